@@ -29,6 +29,10 @@ class FAAScraper:
         self.rate_limit = rate_limit
         self.last_request_time = 0
 
+        # Cache fetched pages so a scraper shared across chart types
+        # only downloads the VFR Raster Charts page once
+        self.page_cache = {}
+
         # Set up session with proper headers
         self.session = requests.Session()
         self.session.headers.update(
@@ -92,7 +96,11 @@ class FAAScraper:
     def get_vfr_page(self) -> str:
         """Get the FAA VFR Raster Charts page."""
         url = "https://www.faa.gov/air_traffic/flight_info/aeronav/digital_products/vfr/"
+        if url in self.page_cache:
+            return self.page_cache[url]
+
         response = self._make_request(url)
+        self.page_cache[url] = response.text
         return response.text
 
     def extract_sectional_charts(self, html: str) -> List[Dict[str, str]]:
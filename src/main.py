@@ -1,31 +1,103 @@
 """Main CLI module for Germany VFR Approach Charts for ForeFlight."""
 
+import contextlib
+import itertools
 import json
 import shutil
 import sys
+import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 
 import typer
-from rich.prompt import Confirm
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
 
-from pdf_generator import PDFGenerator
-from scraper import AIPScraper
-from faa_scraper import FAAScraper
-from mbtiles_converter import MBTilesConverter
-from byop_packager import BYOPPackager
+# The chart modules pull in requests, Pillow, img2pdf and rasterio, and the
+# rich prompt/progress/table modules are only needed by some commands; they
+# are imported where they are used so `info` and `--help` stay fast
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
+    from faa_scraper import FAAScraper
+    from pdf_generator import PDFGenerator
+    from scraper import AIPScraper
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; fall back to the stdlib encoder
+    orjson = None
 
 console = Console()
 app = typer.Typer(help="Germany VFR Approach Charts for ForeFlight BYOP")
 
+# Concurrent chart downloads; kept low to stay polite to the DFS server
+DEFAULT_DOWNLOAD_WORKERS = 4
+
+
+def _zstandard():
+    """Import zstandard, which is only needed for ``.zst`` chart files."""
+    try:
+        import zstandard
+    except ImportError as e:
+        raise RuntimeError(
+            "Compressed (.zst) chart files need the 'zstandard' package"
+        ) from e
+    return zstandard
+
+
+def _save_charts(charts: List[dict], path: Path) -> None:
+    """Write chart data to a JSON file (UTF-8, 2-space indent).
+
+    A ``.zst`` suffix (e.g. ``charts_data.json.zst``) writes zstd-compressed
+    compact JSON instead.
+    """
+    if path.suffix == ".zst":
+        data = orjson.dumps(charts) if orjson is not None else json.dumps(
+            charts, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        path.write_bytes(_zstandard().ZstdCompressor(level=3).compress(data))
+    elif orjson is not None:
+        path.write_bytes(orjson.dumps(charts, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(
+            json.dumps(charts, indent=2, ensure_ascii=False), encoding="utf-8"
+        )
+
+
+# Keys every chart needs to be downloaded and turned into a BYOP PDF
+REQUIRED_CHART_KEYS = ("icao_code", "chart_name", "print_url")
+
+
+def _load_charts(path: Path) -> List[dict]:
+    """Read chart data written by ``_save_charts`` (plain or ``.zst``).
+
+    Raises:
+        ValueError: If the file is not a list of charts or a chart is missing
+            one of ``REQUIRED_CHART_KEYS``
+    """
+    data = path.read_bytes()
+    if path.suffix == ".zst":
+        data = _zstandard().ZstdDecompressor().decompress(data)
+    charts = orjson.loads(data) if orjson is not None else json.loads(data)
+
+    if not isinstance(charts, list):
+        raise ValueError(f"{path} does not contain a list of charts")
+    for index, chart in enumerate(charts):
+        missing = [key for key in REQUIRED_CHART_KEYS if key not in chart]
+        if missing:
+            raise ValueError(
+                f"Chart {index} in {path} is missing: {', '.join(missing)}"
+            )
+    return charts
+
 
 @app.command()
 def scrape(
     output_file: Optional[Path] = typer.Option(
-        None, "--output", "-o", help="Output JSON file for chart data"
+        None, "--output", "-o", help="Output JSON file for chart data (.zst to compress)"
     ),
     display_summary: bool = typer.Option(
         True, "--summary", "-s", help="Display summary of found charts"
@@ -38,6 +110,8 @@ def scrape(
     ),
 ) -> None:
     """Scrape aerodrome charts from DFS AIP site."""
+    from scraper import AIPScraper
+
     console.print(Panel.fit(" Scraping DFS AIP VFR Charts", style="bold blue"))
 
     try:
@@ -51,8 +125,7 @@ def scrape(
             scraper.display_charts_summary(charts)
 
         if output_file:
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(charts, f, indent=2, ensure_ascii=False)
+            _save_charts(charts, output_file)
             console.print(f"[green]Chart data saved to: {output_file}[/green]")
 
         console.print(
@@ -66,70 +139,58 @@ def scrape(
 
 @app.command()
 def download(
-    charts_file: Path = typer.Argument(..., help="JSON file with chart data"),
+    charts_file: Path = typer.Argument(..., help="JSON file with chart data (.json or .json.zst)"),
     output_dir: str = typer.Option(
         "AIP Germany", "--output-dir", "-d", help="Output directory for PDFs"
     ),
     limit: Optional[int] = typer.Option(
         None, "--limit", "-l", help="Limit number of charts to process"
     ),
+    workers: int = typer.Option(
+        DEFAULT_DOWNLOAD_WORKERS,
+        "--workers",
+        "--concurrency",
+        "-w",
+        "-c",
+        min=1,
+        help="Number of chart images to download concurrently",
+    ),
+    force: bool = typer.Option(
+        False, "--force", "-f", help="Regenerate PDFs that already exist"
+    ),
 ) -> None:
     """Download charts and generate PDFs for ForeFlight BYOP."""
+    from pdf_generator import PDFGenerator
+    from scraper import AIPScraper
+
     console.print(
         Panel.fit("Downloading Charts & Generating PDFs", style="bold blue")
     )
 
     try:
         # Load chart data
-        with open(charts_file, "r", encoding="utf-8") as f:
-            charts = json.load(f)
+        charts = _load_charts(charts_file)
 
         if limit:
             charts = charts[:limit]
             console.print(f"[yellow]Limited to {limit} charts[/yellow]")
 
         # Initialize components
-        scraper = AIPScraper()
+        scraper = AIPScraper(max_connections=workers)
         pdf_generator = PDFGenerator(output_dir)
 
         # Download charts and generate PDFs
-        charts_with_images = []
-
-        with console.status("[bold green]Downloading chart images...") as status:
-            for i, chart in enumerate(charts, 1):
-                status.update(f"Downloading {i}/{len(charts)}: {chart['icao_code']}")
-
-                # Build full referrer URL from the chart page URL
-                # The page_url is relative like "../pages/ID.html", need to build the full URL
-                if chart.get("page_url") and hasattr(scraper, "current_date"):
-                    # Convert relative path to absolute
-                    page_href = chart["page_url"].replace("../", "")
-                    referrer_url = f"{scraper.base_url}/BasicVFR/{scraper.current_date}/{page_href}"
-                else:
-                    referrer_url = None
-                image_data = scraper.download_chart_image(
-                    chart["print_url"], referrer_url
-                )
-                if image_data:
-                    charts_with_images.append((chart, image_data))
-                    console.print(
-                        f"[green]Downloaded:[/green] {chart['icao_code']} - {chart['chart_name']}"
-                    )
-                else:
-                    console.print(
-                        f"[red]Failed:[/red] {chart['icao_code']} - {chart['chart_name']}"
-                    )
-
-        # Generate PDFs
-        if charts_with_images:
-            pdf_generator.process_charts_batch(charts_with_images)
+        downloaded, skipped = _download_charts(
+            scraper, pdf_generator, charts, workers=workers, force=force
+        )
 
+        if downloaded or skipped:
             # Create manifest.json (without current_date for download command)
             manifest_path = pdf_generator.create_manifest()
 
             # Display summary
             summary = pdf_generator.get_generated_files_summary()
-            display_download_summary(summary, len(charts), len(charts_with_images))
+            display_download_summary(summary, len(charts), downloaded, skipped)
             
             if manifest_path:
                 console.print(f"[green]Manifest created: {manifest_path}[/green]")
@@ -158,8 +219,20 @@ def full_pipeline(
     save_charts: bool = typer.Option(
         True, "--save-charts", help="Save chart data to JSON file"
     ),
+    workers: int = typer.Option(
+        DEFAULT_DOWNLOAD_WORKERS,
+        "--workers",
+        "--concurrency",
+        "-w",
+        "-c",
+        min=1,
+        help="Number of chart images to download concurrently",
+    ),
 ) -> None:
     """Run complete pipeline: scrape, download, and generate PDFs."""
+    from pdf_generator import PDFGenerator
+    from scraper import AIPScraper
+
     console.print(
         Panel.fit(
             "Full Pipeline: Scrape → Download → Generate PDFs", style="bold blue"
@@ -169,7 +242,7 @@ def full_pipeline(
     try:
         # Step 1: Scrape
         console.print("\n[bold cyan]Step 1: Scraping aerodrome charts...[/bold cyan]")
-        scraper = AIPScraper()
+        scraper = AIPScraper(max_connections=workers)
         charts = scraper.scrape_all_aerodromes(limit_aerodromes=limit)
 
         if limit:
@@ -178,8 +251,7 @@ def full_pipeline(
         # Save chart data if requested
         if save_charts:
             charts_file = Path("charts_data.json")
-            with open(charts_file, "w", encoding="utf-8") as f:
-                json.dump(charts, f, indent=2, ensure_ascii=False)
+            _save_charts(charts, charts_file)
             console.print(f"[green]Chart data saved to: {charts_file}[/green]")
 
         # Step 2: Download and generate PDFs
@@ -188,42 +260,19 @@ def full_pipeline(
         )
         pdf_generator = PDFGenerator(output_dir, current_date=scraper.current_date if hasattr(scraper, 'current_date') else None)
 
-        charts_with_images = []
-        with console.status("[bold green]Downloading chart images...") as status:
-            for i, chart in enumerate(charts, 1):
-                status.update(f"Downloading {i}/{len(charts)}: {chart['icao_code']}")
-
-                # Build full referrer URL from the chart page URL
-                # The page_url is relative like "../pages/ID.html", need to build the full URL
-                if chart.get("page_url") and hasattr(scraper, "current_date"):
-                    # Convert relative path to absolute
-                    page_href = chart["page_url"].replace("../", "")
-                    referrer_url = f"{scraper.base_url}/BasicVFR/{scraper.current_date}/{page_href}"
-                else:
-                    referrer_url = None
-                image_data = scraper.download_chart_image(
-                    chart["print_url"], referrer_url
-                )
-                if image_data:
-                    charts_with_images.append((chart, image_data))
-                    console.print(
-                        f"[green]Downloaded:[/green] {chart['icao_code']} - {chart['chart_name']}"
-                    )
-                else:
-                    console.print(
-                        f"[red]Failed:[/red] {chart['icao_code']} - {chart['chart_name']}"
-                    )
-
-        # Generate PDFs
-        if charts_with_images:
-            pdf_generator.process_charts_batch(charts_with_images)
+        # Always regenerate: PDF names carry no AIRAC date, so an existing
+        # PDF may be from an earlier cycle than the manifest about to be written
+        downloaded, _ = _download_charts(
+            scraper, pdf_generator, charts, workers=workers, force=True
+        )
 
+        if downloaded:
             # Create manifest.json
             manifest_path = pdf_generator.create_manifest()
 
             # Display final summary
             summary = pdf_generator.get_generated_files_summary()
-            display_download_summary(summary, len(charts), len(charts_with_images))
+            display_download_summary(summary, len(charts), downloaded)
 
             console.print(
                 "\n[bold green]Pipeline completed successfully![/bold green]"
@@ -239,18 +288,206 @@ def full_pipeline(
         sys.exit(1)
 
 
+def _iter_chart_images(
+    scraper: "AIPScraper",
+    charts: List[dict],
+    workers: int = DEFAULT_DOWNLOAD_WORKERS,
+) -> Iterator[Tuple[dict, Optional[bytes]]]:
+    """Download chart images concurrently, yielding them as they complete.
+
+    Downloads run on a thread pool; ``download_chart_image`` spends nearly
+    all its time waiting on the network, so threads overlap well. The
+    consumer runs on the calling thread while the remaining downloads
+    continue. Charts sharing a ``print_url`` are fetched once and all get
+    the same image bytes.
+
+    Args:
+        scraper: Scraper used to fetch the chart images
+        charts: Chart dictionaries as produced by the scraper
+        workers: Number of concurrent downloads
+
+    Yields:
+        (chart, image_data) tuples in completion order; image_data is None
+        when the download failed
+    """
+    # Look these up once rather than on every chart
+    current_date = getattr(scraper, "current_date", None)
+    referrer_base = f"{scraper.base_url}/BasicVFR/{current_date}/"
+
+    # Group charts by print URL so duplicates are downloaded only once
+    charts_by_url: Dict[str, List[dict]] = {}
+    for chart in charts:
+        charts_by_url.setdefault(chart["print_url"], []).append(chart)
+
+    workers = max(1, workers)
+    pending = iter(charts_by_url.items())
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        in_flight = {}
+
+        def submit(count: int) -> None:
+            for print_url, url_charts in itertools.islice(pending, count):
+                # Build full referrer URL from the chart page URL
+                # The page_url is relative like "../pages/ID.html", need to build the full URL
+                page_url = url_charts[0].get("page_url")
+                if page_url and current_date:
+                    referrer_url = referrer_base + page_url.removeprefix("../")
+                else:
+                    referrer_url = None
+                future = executor.submit(
+                    scraper.download_chart_image, print_url, referrer_url
+                )
+                in_flight[future] = url_charts
+
+        # Keep at most two downloads per worker outstanding, so finished
+        # images don't pile up in memory while the consumer writes PDFs
+        submit(2 * workers)
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                url_charts = in_flight.pop(future)
+                image_data = future.result()
+                submit(1)
+                for chart in url_charts:
+                    yield chart, image_data
+            # Drop the last image before blocking in wait(), so it is not
+            # kept alive while the next downloads run
+            del done, future, image_data
+
+
+def _download_charts(
+    scraper: "AIPScraper",
+    pdf_generator: "PDFGenerator",
+    charts: List[dict],
+    workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    force: bool = False,
+) -> Tuple[int, int]:
+    """Download every chart image and turn it into a PDF as soon as it arrives.
+
+    Only the images still in flight are held in memory. Charts whose PDF
+    already exists (non-empty) are skipped unless ``force`` is set, so a
+    re-run after a partial failure only fetches what is missing.
+
+    Args:
+        scraper: Scraper used to fetch the chart images
+        pdf_generator: Generator that writes the BYOP PDFs
+        charts: Chart dictionaries as produced by the scraper
+        workers: Number of concurrent downloads
+        force: Download and regenerate charts even if their PDF exists
+
+    Returns:
+        (downloaded, skipped): charts whose image was downloaded, and charts
+        skipped because their PDF already existed
+    """
+    if force:
+        pending = charts
+    else:
+        pending = [chart for chart in charts if not _pdf_exists(pdf_generator, chart)]
+
+    skipped = len(charts) - len(pending)
+    if skipped:
+        console.print(
+            f"[yellow]Skipping {skipped} charts with an existing PDF "
+            "(use --force to regenerate)[/yellow]"
+        )
+    downloaded = 0
+    generated = 0
+    failed_charts = []
+
+    with _download_progress() as progress:
+        task = progress.add_task("Downloading chart images...", total=len(pending))
+
+        for chart, image_data in _iter_chart_images(scraper, pending, workers):
+            if image_data:
+                downloaded += 1
+                if pdf_generator.process_chart(chart, image_data, verbose=False):
+                    generated += 1
+            else:
+                failed_charts.append(chart)
+            progress.update(
+                task, advance=1, description=f"Processed {chart['icao_code']}"
+            )
+
+    console.print(
+        f"[bold green]Successfully generated {generated} PDF files[/bold green]"
+    )
+    if failed_charts:
+        display_failed_downloads(failed_charts)
+
+    return downloaded, skipped
+
+
+def _pdf_exists(pdf_generator: "PDFGenerator", chart: dict) -> bool:
+    """Return True if the chart's BYOP PDF is already on disk and non-empty."""
+    try:
+        return pdf_generator.get_output_path(chart).stat().st_size > 0
+    except OSError:
+        return False
+
+
+def _download_progress() -> "Progress":
+    """Create the progress bar used while downloading chart images."""
+    from rich.progress import (
+        BarColumn,
+        MofNCompleteColumn,
+        Progress,
+        SpinnerColumn,
+        TextColumn,
+        TimeRemainingColumn,
+    )
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeRemainingColumn(),
+        console=console,
+        refresh_per_second=4,
+        # Cleared once finished; the generated count and failure table follow
+        transient=True,
+    )
+
+
+def display_failed_downloads(failed_charts: List[dict]) -> None:
+    """Display the charts whose images could not be downloaded as one table."""
+    from rich.table import Table
+
+    table = Table(title=f"Failed Downloads ({len(failed_charts)})", title_style="red")
+    table.add_column("ICAO", style="cyan")
+    table.add_column("Chart", style="red")
+
+    for chart in failed_charts:
+        table.add_row(chart["icao_code"], chart["chart_name"])
+
+    console.print(table)
+
+
 def display_download_summary(
-    summary: dict, total_charts: int, successful_downloads: int
+    summary: dict, total_charts: int, successful_downloads: int, skipped: int = 0
 ) -> None:
-    """Display a summary of the download and generation process."""
+    """Display a summary of the download and generation process.
+
+    Charts ``skipped`` because their PDF already existed get their own row
+    and are left out of the success rate.
+    """
+    from rich.table import Table
+
     table = Table(title=" Download & Generation Summary")
     table.add_column("Metric", style="cyan")
     table.add_column("Count", style="green")
 
     table.add_row("Total charts found", str(total_charts))
     table.add_row("Successfully downloaded", str(successful_downloads))
+    if skipped:
+        table.add_row("Skipped (PDF exists)", str(skipped))
     table.add_row("PDFs generated", str(summary["total_pdfs"]))
-    table.add_row("Success rate", f"{(successful_downloads/total_charts*100):.1f}%")
+    attempted = total_charts - skipped
+    # No rate when every chart was skipped; max() keeps an empty run (no
+    # charts found) from dividing by zero
+    if attempted or not skipped:
+        success_rate = successful_downloads / max(attempted, 1) * 100
+        table.add_row("Success rate", f"{success_rate:.1f}%")
 
     console.print(table)
 
@@ -274,6 +511,9 @@ def process_realistic(
     ),
 ) -> None:
     """Process aerodromes like a real user: airport → charts → PDFs → next airport."""
+    from pdf_generator import PDFGenerator
+    from scraper import AIPScraper
+
     console.print(
         Panel.fit(
             "Realistic Processing: Airport → Charts → PDFs → Next Airport", 
@@ -329,20 +569,36 @@ def _faa_pipeline(
     max_zoom: int,
     verbose: bool,
     chart_type_label: str,
+    chart_parallel: bool = False,
+    faa_scraper: Optional["FAAScraper"] = None,
+    temp_dir: Optional[Path] = None,
 ) -> List[dict]:
-    """Run the FAA pipeline for a single chart type ("sectional" or "terminal")."""
+    """Run the FAA pipeline for a single chart type ("sectional" or "terminal").
+
+    Pass ``faa_scraper`` to reuse one scraper (session and page cache) across
+    several chart types. Pass ``temp_dir`` to download and extract into a
+    directory owned by the caller; it is then left in place for the caller to
+    clean up.
+    """
+    from faa_scraper import FAAScraper
+    from mbtiles_converter import MBTilesConverter
+
     if chart_type not in {"sectional", "terminal"}:
         raise ValueError(f"Invalid FAA chart type: {chart_type}")
 
-    faa_scraper = FAAScraper()
+    if faa_scraper is None:
+        faa_scraper = FAAScraper()
     mbtiles_converter = MBTilesConverter(
         min_zoom=min_zoom,
         max_zoom=max_zoom,
         verbose=verbose,
+        chart_parallel=chart_parallel,
     )
 
     # Create temporary directories
-    temp_dir = Path(output_dir) / ".temp"
+    owns_temp_dir = temp_dir is None
+    if owns_temp_dir:
+        temp_dir = Path(output_dir) / ".temp"
     download_dir = temp_dir / "downloads"
     extract_dir = temp_dir / "extracted"
     layers_dir = Path(output_dir) / "layers"
@@ -374,15 +630,46 @@ def _faa_pipeline(
         return charts_with_mbtiles
     finally:
         # Clean up temp directories
-        if temp_dir.exists():
+        if owns_temp_dir and temp_dir.exists():
             try:
                 shutil.rmtree(temp_dir)
             except Exception as e:
                 console.print(f"[yellow]Could not clean up temp directory: {e}[/yellow]")
 
 
+def _remove_in_background(path: Path) -> threading.Thread:
+    """Delete a directory tree on a background thread.
+
+    The thread is not a daemon, so the interpreter still waits for the
+    deletion to finish before exiting.
+    """
+    thread = threading.Thread(
+        target=shutil.rmtree,
+        args=(path,),
+        kwargs={"ignore_errors": True},
+        name="temp-cleanup",
+    )
+    thread.start()
+    return thread
+
+
+@contextlib.contextmanager
+def _branch_temp_dir(output_dir: Path) -> Iterator[Path]:
+    """Create a ``.temp-*`` directory under ``output_dir`` for one process-all branch.
+
+    It is removed in the background as soon as the branch exits.
+    """
+    temp_dir = Path(tempfile.mkdtemp(prefix=".temp-", dir=output_dir))
+    try:
+        yield temp_dir
+    finally:
+        _remove_in_background(temp_dir)
+
+
 def _prompt_process_all_sources() -> tuple[bool, bool, bool]:
     """Prompt y/n for sources when running process-all interactively (defaults to Yes)."""
+    from rich.prompt import Confirm
+
     console.print("\n[bold cyan]Select sources to include:[/bold cyan]")
     include_dfs = Confirm.ask("  Include DFS (Germany) PDFs?", default=True)
     include_faa_sectional = Confirm.ask("  Include FAA Sectional (MBTiles)?", default=True)
@@ -416,6 +703,11 @@ def process_faa_sectional(
     verbose: bool = typer.Option(
         False, "--verbose", "-v", help="Verbose output with detailed progress information"
     ),
+    chart_parallel: bool = typer.Option(
+        False,
+        "--chart-parallel/--no-chart-parallel",
+        help="Convert two charts at once (uses more memory and temp disk)",
+    ),
 ) -> None:
     """Process FAA Sectional charts into MBTiles (layers/)."""
     resolved_max_zoom = 9 if (quick and max_zoom is None) else (max_zoom or 12)
@@ -429,6 +721,7 @@ def process_faa_sectional(
         max_zoom=resolved_max_zoom,
         verbose=verbose,
         chart_type_label="Sectional charts",
+        chart_parallel=chart_parallel,
     )
     console.print(
         f"[green]Processed:[/green] {len(charts_with_mbtiles)} FAA Sectional charts"
@@ -461,6 +754,11 @@ def process_faa_terminal(
     verbose: bool = typer.Option(
         False, "--verbose", "-v", help="Verbose output with detailed progress information"
     ),
+    chart_parallel: bool = typer.Option(
+        False,
+        "--chart-parallel/--no-chart-parallel",
+        help="Convert two charts at once (uses more memory and temp disk)",
+    ),
 ) -> None:
     """Process FAA Terminal Area charts into MBTiles (layers/)."""
     resolved_max_zoom = 9 if (quick and max_zoom is None) else (max_zoom or 12)
@@ -474,6 +772,7 @@ def process_faa_terminal(
         max_zoom=resolved_max_zoom,
         verbose=verbose,
         chart_type_label="Terminal charts",
+        chart_parallel=chart_parallel,
     )
     console.print(
         f"[green]Processed:[/green] {len(charts_with_mbtiles)} FAA Terminal Area charts"
@@ -529,8 +828,18 @@ def process_all(
     verbose: bool = typer.Option(
         False, "--verbose", "-v", help="Verbose output with detailed progress information"
     ),
+    faa_chart_parallel: bool = typer.Option(
+        False,
+        "--faa-chart-parallel/--no-faa-chart-parallel",
+        help="Convert two FAA charts at once (uses more memory and temp disk)",
+    ),
 ) -> None:
     """Process all chart sources into a unified BYOP package (DFS + FAA by default)."""
+    from byop_packager import BYOPPackager
+    from faa_scraper import FAAScraper
+    from pdf_generator import PDFGenerator
+    from scraper import AIPScraper
+
     console.print("[bold cyan]Processing selected chart sources into unified BYOP package...[/bold cyan]")
 
     if interactive:
@@ -580,19 +889,35 @@ def process_all(
             
             console.print(f"[green]Processed:[/green] {len(dfs_charts)} DFS charts")
 
+        # Share one FAA scraper between Sectional and Terminal so the session
+        # and the VFR Raster Charts page are reused
+        faa_scraper = (
+            FAAScraper() if (include_faa_sectional or include_faa_terminal) else None
+        )
+
+        # Sectional and Terminal download different zips, so each branch gets
+        # its own temp directory (_branch_temp_dir). It is removed in the
+        # background as soon as that branch is done, so both sets of files
+        # never pile up on disk, and the removal cannot race with the next
+        # branch writing into the same directory
+
         # Process FAA Sectional charts
         if include_faa_sectional:
             resolved_max_zoom = 9 if (faa_quick and faa_max_zoom is None) else (faa_max_zoom or 12)
             console.print("\n[bold cyan]Processing FAA Sectional Charts...[/bold cyan]")
-            charts_with_mbtiles = _faa_pipeline(
-                chart_type="sectional",
-                output_dir=output_dir,
-                limit=limit_faa,
-                min_zoom=faa_min_zoom,
-                max_zoom=resolved_max_zoom,
-                verbose=verbose,
-                chart_type_label="Sectional charts",
-            )
+            with _branch_temp_dir(output_dir) as faa_temp_dir:
+                charts_with_mbtiles = _faa_pipeline(
+                    chart_type="sectional",
+                    output_dir=output_dir,
+                    limit=limit_faa,
+                    min_zoom=faa_min_zoom,
+                    max_zoom=resolved_max_zoom,
+                    verbose=verbose,
+                    chart_type_label="Sectional charts",
+                    chart_parallel=faa_chart_parallel,
+                    faa_scraper=faa_scraper,
+                    temp_dir=faa_temp_dir,
+                )
             console.print(
                 f"[green]Processed:[/green] {len(charts_with_mbtiles)} FAA Sectional charts"
             )
@@ -601,15 +926,19 @@ def process_all(
         if include_faa_terminal:
             resolved_max_zoom = 9 if (faa_quick and faa_max_zoom is None) else (faa_max_zoom or 12)
             console.print("\n[bold cyan]Processing FAA Terminal Area Charts...[/bold cyan]")
-            charts_with_mbtiles = _faa_pipeline(
-                chart_type="terminal",
-                output_dir=output_dir,
-                limit=limit_faa,
-                min_zoom=faa_min_zoom,
-                max_zoom=resolved_max_zoom,
-                verbose=verbose,
-                chart_type_label="Terminal charts",
-            )
+            with _branch_temp_dir(output_dir) as faa_temp_dir:
+                charts_with_mbtiles = _faa_pipeline(
+                    chart_type="terminal",
+                    output_dir=output_dir,
+                    limit=limit_faa,
+                    min_zoom=faa_min_zoom,
+                    max_zoom=resolved_max_zoom,
+                    verbose=verbose,
+                    chart_type_label="Terminal charts",
+                    chart_parallel=faa_chart_parallel,
+                    faa_scraper=faa_scraper,
+                    temp_dir=faa_temp_dir,
+                )
             console.print(
                 f"[green]Processed:[/green] {len(charts_with_mbtiles)} FAA Terminal Area charts"
             )
@@ -659,7 +988,9 @@ def info() -> None:
             "• process-all: Process DFS + FAA into unified package (defaults to all)\n"
             "• process-faa-sectional: Build only FAA sectional MBTiles\n"
             "• process-faa-terminal: Build only FAA terminal MBTiles\n"
-            "• info: Show this information",
+            "• info: Show this information\n\n"
+            f"download and full-pipeline fetch {DEFAULT_DOWNLOAD_WORKERS} charts at a time.\n"
+            "Tune with --workers/--concurrency; stay at 16 or below for DFS.",
             style="bold blue",
         )
     )
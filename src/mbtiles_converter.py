@@ -1,14 +1,23 @@
 """Convert GeoTIFF files to mbtiles format."""
 
+import collections
 import concurrent.futures
+import contextlib
+import functools
 import io
+import itertools
 import json
+import multiprocessing
 import os
+import queue
+import shutil
+import signal
 import time
 import sqlite3
 import subprocess
+import threading
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
 import numpy as np
 from PIL import Image
@@ -22,6 +31,7 @@ from rich.progress import (
     TimeRemainingColumn,
 )
 from rasterio.warp import transform_bounds
+from rio_tiler.errors import TileOutsideBounds
 from rio_tiler.io import COGReader
 from rio_cogeo.cogeo import cog_translate
 from rio_cogeo.profiles import cog_profiles
@@ -34,20 +44,69 @@ try:
     _gdal_for_warnings.UseExceptions()
 except Exception:
     pass
+try:
+    # Optional: libjpeg-turbo's API encodes straight from a NumPy array
+    from turbojpeg import TJPF_RGB, TJPF_RGBX, TJSAMP_420, TurboJPEG
+except ImportError:
+    TurboJPEG = None
 
 console = Console()
 
 
 
 # Worker globals for parallel tile processing
-_worker_cog_reader: Optional[COGReader] = None
-_worker_tms = None
+# Per-worker state lives in a thread-local so the same worker functions serve
+# both thread pools (one reader per thread) and process pools (one per process)
+_worker = threading.local()
 _worker_logged = False
 
 
-def _worker_init(cog_path: str, tms_id: str) -> None:
-    """Initializer for worker processes to open COGReader once per process."""
-    global _worker_cog_reader, _worker_tms
+def _load_turbojpeg():
+    """Return a TurboJPEG encoder, or None if PyTurboJPEG or libturbojpeg is missing."""
+    # _encode_jpeg needs optimize(), which older PyTurboJPEG releases lack
+    if TurboJPEG is None or not hasattr(TurboJPEG, "optimize"):
+        return None
+    try:
+        return TurboJPEG()
+    except Exception:
+        # PyTurboJPEG is installed but the shared library could not be loaded
+        return None
+
+
+def _encode_jpeg(rgb: np.ndarray, quality: int, tjpeg=None) -> bytes:
+    """Encode an H x W x 3 (RGB) or H x W x 4 (RGBX) uint8 array as a 4:2:0 JPEG.
+
+    The fourth channel of an RGBX array is ignored. Uses ``tjpeg`` (from
+    ``_load_turbojpeg``) when available, otherwise Pillow. Both paths use
+    optimized Huffman tables, which roughly halve the size of chart tiles.
+    """
+    rgbx = rgb.shape[2] == 4
+    if tjpeg is not None:
+        # TurboJPEG's encoder has no Huffman optimization option; optimize()
+        # rewrites the entropy-coded data losslessly, like jpegtran -optimize
+        return tjpeg.optimize(
+            tjpeg.encode(
+                np.ascontiguousarray(rgb),
+                quality=quality,
+                pixel_format=TJPF_RGBX if rgbx else TJPF_RGB,
+                jpeg_subsample=TJSAMP_420,
+            )
+        )
+    buf = io.BytesIO()
+    Image.fromarray(rgb, mode="RGBX" if rgbx else "RGB").save(
+        buf, format="JPEG", quality=quality, optimize=True, subsampling=2
+    )
+    return buf.getvalue()
+
+
+def _worker_init(
+    cog_path: str, tms_id: str, open_readers: Optional[queue.SimpleQueue] = None
+) -> None:
+    """Initializer for worker threads/processes to open a COGReader once each.
+
+    In a thread pool, ``open_readers`` may hold COGReaders the caller already
+    opened on ``cog_path``; a worker takes one of those before opening its own.
+    """
     
     # Suppress warnings in worker processes
     import warnings
@@ -62,179 +121,666 @@ def _worker_init(cog_path: str, tms_id: str) -> None:
             message=".*NodataShadowWarning.*",
         )
     
-    _worker_tms = morecantile.tms.get(tms_id)
-    _worker_cog_reader = COGReader(cog_path, tms=_worker_tms)
+    _worker.tms = morecantile.tms.get(tms_id)
+    try:
+        _worker.cog_reader = open_readers.get_nowait() if open_readers else None
+    except queue.Empty:
+        _worker.cog_reader = None
+    # Only readers opened here are closed by _worker_close; borrowed ones
+    # stay with the caller
+    _worker.owns_reader = _worker.cog_reader is None
+    if _worker.owns_reader:
+        _worker.cog_reader = COGReader(cog_path, tms=_worker.tms)
+    # Single-band (gray) charts are broadcast to R == G == B
+    _worker.gray = _worker.cog_reader.dataset.count < 3
+    _worker.tjpeg = _load_turbojpeg()
+
+
+def _worker_close(barrier: threading.Barrier) -> None:
+    """Close the COGReader this pool thread opened in ``_worker_init``."""
+    # Every pool thread takes exactly one of these jobs: none returns until
+    # all of them are running
+    barrier.wait()
+    if getattr(_worker, "owns_reader", False):
+        _worker.cog_reader.close()
+    _worker.cog_reader = None
+
+
+@contextlib.contextmanager
+def _closing_worker_readers(
+    executor: concurrent.futures.ThreadPoolExecutor, workers: int
+) -> Iterator[None]:
+    """On exit, have each of the ``workers`` pool threads close its COGReader.
+
+    rasterio datasets have to be closed on the thread that opened them, so
+    this runs one ``_worker_close`` job per thread rather than closing the
+    readers from the caller.
+    """
+    try:
+        yield
+    finally:
+        barrier = threading.Barrier(workers)
+        concurrent.futures.wait(
+            [executor.submit(_worker_close, barrier) for _ in range(workers)]
+        )
 
 
-def _worker_process_tile(args: Tuple[int, int, int, int, int]) -> Tuple[str, int, int, int, Optional[bytes], bool, Optional[str]]:
-    """Process a single tile in a worker process.
+# Tiles in the top OVERVIEW_DEPTH zoom levels are not read from the COG: each
+# pool job reads the max_zoom tiles under one tile and builds its ancestors
+# from them by 2x2 averaging, keeping at most 4 tiles per level in memory
+OVERVIEW_DEPTH = 3
 
-    Returns:
+
+def _tile_rgba(data: np.ndarray, mask: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Pack a rio-tiler (bands, H, W) tile and its mask into an H x W x 4 array.
+
+    The array is filled band by band (gray is broadcast to RGB) instead of
+    moveaxis/repeat/dstack copies. ``out`` is reused when its shape fits.
+    """
+    height, width = data.shape[1:]
+    if out is None or out.shape[:2] != (height, width):
+        out = np.empty((height, width, 4), dtype=np.uint8)
+    if data.shape[0] >= 3:
+        out[..., 0] = data[0]
+        out[..., 1] = data[1]
+        out[..., 2] = data[2]
+    else:
+        out[..., :3] = data[0][..., None]
+    out[..., 3] = mask
+    return out
+
+
+def _downsample_quad(children: list, tile_size: int) -> np.ndarray:
+    """Average four child tiles (row-major: NW, NE, SW, SE) into their parent.
+
+    Missing children (None) are left transparent. Pillow's 2x2 reduce
+    weights colors by alpha, so transparent pixels do not darken the edges
+    of the chart.
+    """
+    half = tile_size // 2
+    parent = np.zeros((tile_size, tile_size, 4), dtype=np.uint8)
+    for index, child in enumerate(children):
+        if child is None:
+            continue
+        row, col = divmod(index, 2)
+        parent[row * half:(row + 1) * half, col * half:(col + 1) * half] = np.asarray(
+            Image.fromarray(child, mode="RGBA").reduce(2)
+        )
+    return parent
+
+
+def _alpha_bounds(rgba: np.ndarray) -> Tuple[int, int]:
+    """Return the (min, max) alpha of a C-contiguous H x W x 4 uint8 array.
+
+    As in ``_alpha_is_empty``, each pixel is read as one little-endian word
+    with alpha in the top byte, so both reductions run over contiguous words
+    instead of the strided alpha plane.
+    """
+    words = rgba.view("<u4")
+    return int(words.min()) >> 24, int(words.max()) >> 24
+
+
+def _encode_png(rgba: np.ndarray, gray: bool = False) -> bytes:
+    """Encode an H x W x 4 uint8 array as PNG, paletted when it has <= 256 colors.
+
+    Charts come from paletted GeoTIFFs, so most tiles read at full
+    resolution fit a palette exactly; those are stored as 8-bit PNGs with
+    a tRNS chunk (lossless, and a fraction of the RGBA size). Other tiles
+    are stored as gray+alpha (LA) if ``gray`` (R == G == B), else RGBA.
+    """
+    img = Image.fromarray(rgba, mode="RGBA")
+    buf = io.BytesIO()
+    # getcolors() gives up (None) as soon as a 257th color turns up
+    colors = img.getcolors(256)
+    if colors is not None:
+        palette = np.array([color for _, color in colors], dtype=np.uint8)
+        # Map each pixel to its palette entry by its RGBA word
+        words = palette.view("<u4").ravel()
+        order = np.argsort(words)
+        words, palette = words[order], palette[order]
+        indices = np.searchsorted(words, rgba.view("<u4")[..., 0]).astype(np.uint8)
+        img = Image.fromarray(indices, mode="P")
+        img.putpalette(palette[:, :3].tobytes())
+        img.info["transparency"] = palette[:, 3].tobytes()
+    elif gray:
+        img = Image.fromarray(np.ascontiguousarray(rgba[..., ::3]), mode="LA")
+    # Fastest zlib level: tiles are read locally from sqlite, so encode
+    # time matters more than the slightly larger PNGs
+    img.save(buf, format="PNG", compress_level=1)
+    return buf.getvalue()
+
+
+def _encode_tile(rgba: np.ndarray, has_alpha: bool) -> bytes:
+    """Encode an RGBA tile: PNG if ``has_alpha``, else JPEG."""
+    if has_alpha:
+        return _encode_png(rgba, _worker.gray)
+    return _encode_jpeg(rgba, 75, _worker.tjpeg)
+
+
+def _render_tile_tree(
+    cog_reader: COGReader,
+    x: int,
+    y: int,
+    z: int,
+    leaf_zoom: int,
+    alpha_threshold: int,
+    tile_size: int,
+    results: list,
+    out: Optional[np.ndarray] = None,
+) -> Optional[np.ndarray]:
+    """Render tile (x, y, z) and its descendants down to ``leaf_zoom``.
+
+    Leaf tiles are read from the COG; every other tile is averaged from its
+    four children. One result tuple per tile is appended to ``results``
+    (children first). Returns the tile's RGBA array, or None if it is empty.
+    """
+    if z == leaf_zoom:
+        try:
+            data, mask = cog_reader.tile(x, y, z, tilesize=tile_size)
+        except Exception as e:  # pragma: no cover - defensive
+            results.append(("error", z, x, y, None, False, str(e)))
+            return None
+        # The mask is contiguous, so these scans are cheap; no extra pass
+        # over the RGBA buffer is needed
+        if mask.max() <= alpha_threshold:
+            results.append(("dropped", z, x, y, None, False, None))
+            return None
+        has_alpha = mask.min() < 255
+        rgba = _tile_rgba(data, mask, out)
+    else:
+        children = [
+            _render_tile_tree(
+                cog_reader, 2 * x + dx, 2 * y + dy, z + 1,
+                leaf_zoom, alpha_threshold, tile_size, results,
+            )
+            for dy in (0, 1)
+            for dx in (0, 1)
+        ]
+        if all(child is None for child in children):
+            results.append(("dropped", z, x, y, None, False, None))
+            return None
+        rgba = _downsample_quad(children, tile_size)
+        alpha_min, alpha_max = _alpha_bounds(rgba)
+        if alpha_max <= alpha_threshold:
+            results.append(("dropped", z, x, y, None, False, None))
+            return None
+        has_alpha = alpha_min < 255
+
+    tile_data_bytes = _encode_tile(rgba, has_alpha)
+    results.append(("ok", z, x, y, tile_data_bytes, has_alpha, None))
+    return rgba
+
+
+def _worker_process_tile(
+    args: Tuple[int, int, int, int, int, int]
+) -> List[Tuple[str, int, int, int, Optional[bytes], bool, Optional[str]]]:
+    """Process a tile, and its descendants down to ``leaf_zoom``, in a worker.
+
+    Args are (x, y, z, leaf_zoom, alpha_threshold, tile_size); pass
+    ``leaf_zoom == z`` to read just the one tile from the COG.
+
+    Returns a list with one entry per tile:
         ("ok", z, x, y, tile_bytes, has_alpha, None) on success
         ("dropped", z, x, y, None, False, None) if transparent
         ("error", z, x, y, None, False, error_message) on error
     """
-    global _worker_cog_reader
-    if _worker_cog_reader is None:
-        return ("error", -1, -1, -1, None, False, "COGReader not initialized")
-
-    x, y, z, alpha_threshold, tile_size = args
-    try:
-        data, mask = _worker_cog_reader.tile(x, y, z, tilesize=tile_size)
-    except Exception as e:  # pragma: no cover - defensive
-        return ("error", z, x, y, None, False, str(e))
+    x, y, z, leaf_zoom, alpha_threshold, tile_size = args
+    cog_reader = getattr(_worker, "cog_reader", None)
+    if cog_reader is None:
+        return [("error", -1, -1, -1, None, False, "COGReader not initialized")]
 
     global _worker_logged
     if not _worker_logged:
         _worker_logged = True
 
-    if mask.max() <= alpha_threshold:
-        return ("dropped", z, x, y, None, False, None)
+    # A lone tile is encoded before the next read, so it can use the
+    # reusable per-worker buffer
+    out = None
+    if z == leaf_zoom:
+        out = _worker.rgba = getattr(_worker, "rgba", None)
+    results: list = []
+    rgba = _render_tile_tree(
+        cog_reader, x, y, z, leaf_zoom, alpha_threshold, tile_size, results, out
+    )
+    if z == leaf_zoom and rgba is not None:
+        _worker.rgba = rgba
+    return results
+
+
+def _base_tiles_with_data(
+    cog: COGReader, tms, tiles: list, zoom: int, tile_size: int, alpha_threshold: int
+) -> set:
+    """Return (x, y) of the ``tiles`` at ``zoom`` whose mask exceeds ``alpha_threshold``.
+
+    Instead of one ``cog.tile`` call per tile, the whole tile block is read
+    with a single ``cog.part`` and the mask is max-reduced per tile. Each
+    tile is sampled at up to ``tile_size`` px (full resolution for small
+    charts), and never below 64 px, to keep the read bounded. A downsampled
+    read can miss thin features, so empty tiles next to tiles with data are
+    checked again with a full-size ``cog.tile``.
+    """
+    if not tiles:
+        return set()
+    xs = [t.x for t in tiles]
+    ys = [t.y for t in tiles]
+    min_x, min_y = min(xs), min(ys)
+    nx, ny = max(xs) - min_x + 1, max(ys) - min_y + 1
+    samples = max(64, min(tile_size, 2048 // max(nx, ny)))
+
+    upper_left = tms.xy_bounds(morecantile.Tile(min_x, min_y, zoom))
+    lower_right = tms.xy_bounds(morecantile.Tile(min_x + nx - 1, min_y + ny - 1, zoom))
+    img = cog.part(
+        (upper_left.left, lower_right.bottom, lower_right.right, upper_left.top),
+        dst_crs=tms.crs,
+        bounds_crs=tms.crs,
+        width=nx * samples,
+        height=ny * samples,
+        max_size=None,
+    )
+    tile_max = img.mask.reshape(ny, samples, nx, samples).max(axis=(1, 3))
+    wanted = set(zip(xs, ys))
+    found = {
+        (min_x + int(i), min_y + int(j))
+        for j, i in zip(*np.nonzero(tile_max > alpha_threshold))
+        if (min_x + int(i), min_y + int(j)) in wanted
+    }
+    if samples < tile_size:
+        # Chart data is contiguous, so only tiles bordering data can hold a
+        # missed feature (e.g. a 1 px line); spread out from every tile found
+        checked = set(found)
+        frontier = list(found)
+        while frontier:
+            x, y = frontier.pop()
+            for neighbour in ((x + dx, y + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)):
+                if neighbour in checked or neighbour not in wanted:
+                    continue
+                checked.add(neighbour)
+                try:
+                    _, mask = cog.tile(*neighbour, zoom, tilesize=tile_size)
+                except TileOutsideBounds:
+                    continue
+                if mask.max() > alpha_threshold:
+                    found.add(neighbour)
+                    frontier.append(neighbour)
+    return found
+
 
-    has_alpha = mask.min() < 255
-    arr = np.moveaxis(data, 0, -1)
+def _iter_rows(rows: np.ndarray, block: int = 4096) -> Iterator[list]:
+    """Yield the rows of a 2-D array as lists of Python ints, ``block`` rows at a time."""
+    for start in range(0, len(rows), block):
+        yield from rows[start:start + block].tolist()
 
-    tile_data_bytes: Optional[bytes] = None
-    if has_alpha:
-        if arr.shape[2] == 1:
-            arr = np.repeat(arr, 3, axis=2)
-        rgba = np.dstack([arr, mask])
-        img = Image.fromarray(rgba.astype(np.uint8), mode="RGBA")
-        buf = io.BytesIO()
-        img.save(buf, format="PNG", optimize=True)
-        tile_data_bytes = buf.getvalue()
-    else:
-        if arr.shape[2] == 1:
-            arr = np.repeat(arr, 3, axis=2)
-        rgb = Image.fromarray(arr.astype(np.uint8), mode="RGB")
-        buf = io.BytesIO()
-        rgb.save(buf, format="JPEG", quality=75, optimize=True, subsampling=2)
-        tile_data_bytes = buf.getvalue()
 
-    return ("ok", z, x, y, tile_data_bytes, has_alpha, None)
+def _map_chunk(fn: Callable, chunk: list) -> list:
+    """Apply ``fn`` to each item of ``chunk`` inside a pool worker."""
+    return [fn(item) for item in chunk]
 
 
-class MBTilesConverter:
-    """Convert GeoTIFF files to mbtiles format."""
+def _imap_unordered(
+    executor: concurrent.futures.Executor,
+    fn: Callable,
+    items: Iterable,
+    chunksize: int,
+    window: int,
+) -> Iterator:
+    """Yield ``fn(item)`` results in completion order, like Pool.imap_unordered.
 
-    def __init__(self, min_zoom: int = 6, max_zoom: int = 12, verbose: bool = False):
-        """Initialize the mbtiles converter.
+    Items are sent in chunks of ``chunksize``, with at most ``window`` chunks
+    in flight, so one slow tile does not hold back finished ones the way
+    ordered ``executor.map`` does.
+    """
+    items = iter(items)
+    chunks = iter(lambda: list(itertools.islice(items, chunksize)), [])
+    pending = {executor.submit(_map_chunk, fn, chunk) for chunk in itertools.islice(chunks, window)}
+    while pending:
+        done, pending = concurrent.futures.wait(
+            pending, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for chunk in itertools.islice(chunks, len(done)):
+            pending.add(executor.submit(_map_chunk, fn, chunk))
+        for future in done:
+            yield from future.result()
+
+
+# Bulk MBTiles writing: tiles are buffered and inserted TILE_BATCH_SIZE at a
+# time, sorted by key, and the unique index is only built once at the end
+TILE_BATCH_SIZE = 1000
+# Tile payload built in an in-memory database before being copied to disk.
+# Outputs estimated to be bigger are written to the file directly, and an
+# in-memory load that outgrows it is moved to disk (_spill_mbtiles_to_disk)
+MEMORY_DB_BUDGET_BYTES = 1 << 30
+_INSERT_TILE_SQL = (
+    "INSERT INTO tiles (zoom_level, tile_column, tile_row, tile_data) "
+    "VALUES (?, ?, ?, ?)"
+)
 
-        Args:
-            min_zoom: Minimum zoom level for tiles (default: 6, shows when zoomed out)
-            max_zoom: Maximum zoom level for tiles (default: 12, reasonable detail)
-            verbose: If True, show detailed progress output; if False, show progress bar with status
-        """
-        self.min_zoom = min_zoom
-        self.max_zoom = max_zoom
-        self.verbose = verbose
-        self.tile_size = 512  # Use 512x512 tiles for better performance
 
-    def _check_gdal_available(self) -> bool:
-        """Check if GDAL is available on the system.
+# Helpers for the gdal2tiles fallback (MBTilesConverter.convert_with_gdal2tiles)
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
 
-        Returns:
-            True if GDAL is available, False otherwise
-        """
+
+def _png_has_alpha(data: bytes) -> bool:
+    """Return True if ``data`` is a PNG whose IHDR color type carries alpha.
+
+    Color types 4 (gray + alpha) and 6 (RGBA) are read straight from the
+    header, so no pixels are decoded.
+    """
+    return len(data) > 25 and data[:8] == _PNG_SIGNATURE and data[25] in (4, 6)
+
+
+def _alpha_is_empty(pixels: np.ndarray) -> bool:
+    """Return True if every alpha value of an H x W x C image array is zero.
+
+    Alpha is the last channel (LA or RGBA). For uint8 data each pixel is
+    viewed as one little-endian integer with alpha in the top byte, so a
+    single max() over contiguous words replaces a strided scan of the
+    alpha plane.
+    """
+    channels = pixels.shape[-1]
+    if pixels.dtype == np.uint8 and channels in (2, 4) and pixels.flags.c_contiguous:
+        words = pixels.view(f"<u{channels}")
+        return int(words.max()) < 1 << (8 * (channels - 1))
+    return not pixels[..., -1].any()
+
+
+def _recode_worker_init() -> None:
+    """Initializer for _recode_tile worker processes."""
+    _worker.tjpeg = _load_turbojpeg()
+
+
+def _recode_tile(
+    args: Tuple[str, int, int, int, bool, int]
+) -> Tuple[int, int, int, Optional[bytes]]:
+    """Read one gdal2tiles tile and prepare it for the mbtiles tiles table.
+
+    Args are (path, zoom, column, tms_row, compress_jpeg, jpeg_quality).
+
+    Returns:
+        (zoom, column, tms_row, tile_data); tile_data is None for a fully
+        transparent tile that should be dropped.
+    """
+    path, zoom, column, tms_row, compress_jpeg, jpeg_quality = args
+
+    with open(path, "rb") as f:
+        raw_data = f.read()
+
+    tile_data = raw_data
+    # Tiles that are already JPEG are stored as-is: decoding and re-encoding
+    # them would only cost time and add a second generation of artifacts
+    if compress_jpeg and not raw_data.startswith(b"\xff\xd8"):
         try:
-            result = subprocess.run(
-                ["gdalinfo", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+            img = Image.open(io.BytesIO(raw_data))
+            if _png_has_alpha(raw_data):
+                # Detect fully transparent tiles and skip them
+                if _alpha_is_empty(np.asarray(img)):
+                    return zoom, column, tms_row, None
+                # keep PNG to preserve transparency
+            else:
+                # Decode once; convert() would make a second full copy of
+                # tiles that are already RGB
+                if img.mode != "RGB":
+                    img = img.convert("RGB")
+                tile_data = _encode_jpeg(np.asarray(img), jpeg_quality, _worker.tjpeg)
+        except Exception:
+            tile_data = raw_data  # fallback to original
 
-    def _check_gdal2mbtiles_available(self) -> bool:
-        """Check if gdal2mbtiles script is available.
+    return zoom, column, tms_row, tile_data
 
-        Returns:
-            True if gdal2mbtiles is available, False otherwise
+
+def _tile_key(row: Tuple[int, int, int, bytes]) -> Tuple[int, int, int]:
+    return row[0], row[1], row[2]
+
+
+def _open_mbtiles_for_bulk_write(output_path: Path, in_memory: bool = False) -> sqlite3.Connection:
+    """Create an empty MBTiles database tuned for a single bulk load.
+
+    The tiles table is created without its unique index; call
+    ``_finish_mbtiles_bulk_write`` once all tiles are in. The connection is
+    in autocommit mode (``isolation_level=None``); transactions are opened
+    explicitly by the batch writer. With ``in_memory`` the database is built
+    in RAM and only written to ``output_path`` when it is finished.
+    """
+    conn = sqlite3.connect(":memory:" if in_memory else str(output_path), isolation_level=None)
+    # page_size only takes effect before the first table is created
+    conn.execute("PRAGMA page_size=8192")
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA wal_autocheckpoint=10000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+    conn.execute(
         """
-        try:
-            result = subprocess.run(
-                ["gdal2mbtiles", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        CREATE TABLE IF NOT EXISTS tiles (
+            zoom_level INTEGER,
+            tile_column INTEGER,
+            tile_row INTEGER,
+            tile_data BLOB
+        )
+    """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS metadata (
+            name TEXT,
+            value TEXT
+        )
+    """
+    )
+    return conn
 
-    def _check_gdal2tiles_available(self) -> bool:
-        """Check if gdal2tiles.py script is available.
 
-        Returns:
-            True if gdal2tiles.py is available, False otherwise
+def _write_tile_batch(conn: sqlite3.Connection, batch: list) -> None:
+    """Insert buffered (zoom, column, tms_row, data) rows in one transaction.
+
+    Rows are sorted by tile key first so the table grows in key order.
+    The batch list is emptied afterwards.
+    """
+    if not batch:
+        return
+    batch.sort(key=_tile_key)
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.executemany(_INSERT_TILE_SQL, batch)
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    batch.clear()
+
+
+def _spill_mbtiles_to_disk(conn: sqlite3.Connection, output_path: Path) -> sqlite3.Connection:
+    """Copy an ``in_memory`` bulk-write database to ``output_path`` and return a connection to it.
+
+    The in-memory connection is closed; the load continues on the returned
+    one, which is finished with ``_finish_mbtiles_bulk_write`` as usual.
+    """
+    disk = _open_mbtiles_for_bulk_write(output_path)
+    conn.backup(disk)
+    conn.close()
+    return disk
+
+
+def _finish_mbtiles_bulk_write(conn: sqlite3.Connection, backup_to: Optional[Path] = None) -> None:
+    """Index the tiles table and close the database.
+
+    For a database opened ``in_memory``, pass ``backup_to`` to copy it to
+    disk in one sequential write before it is closed.
+
+    Tiles are loaded with plain INSERTs and no index, so a tile written
+    twice leaves two rows; duplicates are resolved here (last insert wins)
+    before the unique index is built. The journal is switched
+    back from WAL so the .mbtiles is a single self-contained file.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute(
+            """
+            DELETE FROM tiles WHERE rowid NOT IN (
+                SELECT MAX(rowid) FROM tiles
+                GROUP BY zoom_level, tile_column, tile_row
+            )
         """
+        )
+        conn.execute(
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS tile_index
+            ON tiles (zoom_level, tile_column, tile_row)
+        """
+        )
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    conn.execute("PRAGMA optimize")
+    if backup_to is not None:
+        dest = sqlite3.connect(str(backup_to))
         try:
-            # Try common locations
-            import shutil
-            gdal2tiles = shutil.which("gdal2tiles.py") or shutil.which("gdal2tiles")
-            if gdal2tiles:
-                result = subprocess.run(
-                    [gdal2tiles, "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                return result.returncode == 0
-            return False
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+            conn.backup(dest)
+        finally:
+            dest.close()
+    else:
+        # Leaving WAL mode checkpoints the log and removes the -wal/-shm files
+        conn.execute("PRAGMA journal_mode=DELETE")
+    conn.close()
 
-    def convert_with_gdal2mbtiles(
-        self, geotiff_path: Path, output_path: Path
-    ) -> bool:
-        """Convert GeoTIFF to mbtiles using gdal2mbtiles script.
 
-        Args:
-            geotiff_path: Path to input GeoTIFF file
-            output_path: Path to output mbtiles file
+def _run_streamed(cmd: List[str], timeout: float, tail: int = 50) -> Tuple[int, List[str]]:
+    """Run a command, reading its combined stdout/stderr line by line.
 
-        Returns:
-            True if successful, False otherwise
-        """
-        
+    Only the last ``tail`` lines are kept, so memory stays flat no matter how
+    much a long GDAL run prints.
 
+    Returns:
+        (returncode, last output lines)
+
+    Raises:
+        subprocess.TimeoutExpired: if the command runs longer than ``timeout``
+    """
+    # On POSIX the command gets its own process group, so a timeout also kills
+    # helpers it forks (gdal2tiles --processes workers), which would otherwise
+    # keep the pipe open. Elsewhere only the command itself is killed.
+    posix = os.name == "posix"
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        start_new_session=posix,
+    )
+    timed_out = threading.Event()
+
+    def _kill() -> None:
+        timed_out.set()
         try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if posix:
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
+        except ProcessLookupError:
+            pass
 
-            cmd = [
-                "gdal2mbtiles",
-                "-z",
-                f"{self.min_zoom}-{self.max_zoom}",
-                str(geotiff_path),
-                str(output_path),
-            ]
+    # Reading stdout blocks, so enforce the deadline from a timer thread
+    timer = threading.Timer(timeout, _kill)
+    timer.start()
+    try:
+        lines = collections.deque(maxlen=tail)
+        with proc.stdout:
+            for line in proc.stdout:
+                lines.append(line.rstrip())
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout, output="\n".join(lines))
+    return returncode, list(lines)
+
+
+@functools.lru_cache(maxsize=None)
+def _command_succeeds(*cmd: str) -> bool:
+    """Run a short probe command once per process and cache whether it exited 0."""
+    # A missing tool is answered from PATH without spawning a process
+    if shutil.which(cmd[0]) is None:
+        return False
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+        return result.returncode == 0
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return False
 
-            
 
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=3600
-            )
+@functools.lru_cache(maxsize=None)
+def _find_gdal2tiles() -> Optional[str]:
+    """Locate gdal2tiles.py (or gdal2tiles) on PATH, once per process."""
+    return shutil.which("gdal2tiles.py") or shutil.which("gdal2tiles")
 
-            
 
-            if result.returncode == 0:
-                return True
-            else:
-                console.print(
-                    f"[red]gdal2mbtiles failed: {result.stderr}[/red]"
-                )
-                return False
+# convert_batch converts at most MAX_PARALLEL_CHARTS charts at once: each one
+# has its own GDAL threads, block cache, tile pool and temporary COG
+MAX_PARALLEL_CHARTS = 2
 
-        except subprocess.TimeoutExpired:
-            console.print("[red]Conversion timed out[/red]")
-            
-            return False
-        except Exception as e:
-            console.print(f"[red]Error converting with gdal2mbtiles: {e}[/red]")
-            
-            return False
+
+def _convert_one(args: Tuple[Path, Path, int, int, bool, int, int]) -> bool:
+    """Convert one chart in a convert_batch worker process."""
+    (geotiff_path, mbtiles_path, min_zoom, max_zoom, use_processes,
+     tile_workers, gdal_threads) = args
+    # The parent owns the terminal (its progress bar); failures are reported
+    # through the return value
+    console.quiet = True
+    converter = MBTilesConverter(
+        min_zoom=min_zoom,
+        max_zoom=max_zoom,
+        use_processes=use_processes,
+        tile_workers=tile_workers,
+        gdal_threads=gdal_threads,
+    )
+    return converter.convert(geotiff_path, mbtiles_path, verbose=False)
+
+
+class MBTilesConverter:
+    """Convert GeoTIFF files to mbtiles format."""
+
+    def __init__(
+        self,
+        min_zoom: int = 6,
+        max_zoom: int = 12,
+        verbose: bool = False,
+        use_processes: bool = False,
+        tile_workers: Optional[int] = None,
+        chart_parallel: bool = False,
+        gdal_threads: Optional[int] = None,
+    ):
+        """Initialize the mbtiles converter.
+
+        Args:
+            min_zoom: Minimum zoom level for tiles (default: 6, shows when zoomed out)
+            max_zoom: Maximum zoom level for tiles (default: 12, reasonable detail)
+            verbose: If True, show detailed progress output; if False, show progress bar with status
+            use_processes: Render tiles in worker processes instead of threads
+                (fallback for GDAL builds that are not thread-safe)
+            tile_workers: Size of the per-chart tile pool (default: all cores but two)
+            chart_parallel: Let convert_batch convert up to MAX_PARALLEL_CHARTS
+                charts at once
+            gdal_threads: GDAL_NUM_THREADS for building the COG (default: all cores)
+        """
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+        self.verbose = verbose
+        self.use_processes = use_processes
+        self.tile_workers = tile_workers or max(2, (os.cpu_count() or 1) - 2)
+        self.chart_parallel = chart_parallel
+        self.gdal_threads = gdal_threads
+        self.tile_size = 512  # Use 512x512 tiles for better performance
+
+    def _check_gdal2tiles_available(self) -> bool:
+        """Check if gdal2tiles.py script is available.
+
+        Returns:
+            True if gdal2tiles.py is available, False otherwise
+        """
+        gdal2tiles = _find_gdal2tiles()
+        return bool(gdal2tiles) and _command_succeeds(gdal2tiles, "--version")
 
     def _check_and_convert_paletted_geotiff(
         self, geotiff_path: Path, temp_dir: Path, verbose: bool = False
@@ -258,13 +804,7 @@ class MBTilesConverter:
                 return None
 
             # Check if it's paletted (indexed color)
-            band = src_ds.GetRasterBand(1)
-            color_table = band.GetColorTable()
-
-            
-
-            src_ds = None
-            band = None
+            color_table = src_ds.GetRasterBand(1).GetColorTable()
 
             if color_table is not None:
                 # Use VRT format instead of full RGBA conversion (much faster!)
@@ -273,33 +813,26 @@ class MBTilesConverter:
                     console.print("[cyan]Creating VRT for paletted GeoTIFF (expanding to RGBA on-the-fly)...[/cyan]")
                 vrt_path = temp_dir / f"{geotiff_path.stem}_rgba.vrt"
 
-                cmd = [
-                    "gdal_translate",
-                    "-of",
-                    "VRT",
-                    "-expand",
-                    "rgba",
-                    "-a_nodata",
-                    "0",
-                    str(geotiff_path),
-                    str(vrt_path),
-                ]
-
-                
-
-                result = subprocess.run(
-                    cmd, capture_output=True, text=True, timeout=60
-                )
-
-                if result.returncode == 0 and vrt_path.exists():
-                    
-                    return vrt_path
-                else:
-                    console.print(
-                        f"[yellow]Warning: Failed to create VRT: {result.stderr}[/yellow]"
+                # Built in-process from the already-open dataset. It is written
+                # to disk (not /vsimem/) because rasterio and the tile worker
+                # processes read it through their own GDAL.
+                try:
+                    vrt_ds = gdal.Translate(
+                        str(vrt_path),
+                        src_ds,
+                        options=gdal.TranslateOptions(format="VRT", rgbExpand="rgba", noData=0),
                     )
-                    
+                except RuntimeError as e:
+                    vrt_ds = None
+                    console.print(f"[yellow]Warning: Failed to create VRT: {e}[/yellow]")
+                src_ds = None
+
+                if vrt_ds is None:
                     return None
+                vrt_ds = None  # flush the VRT to disk
+                return vrt_path
+
+            src_ds = None
 
             return geotiff_path  # Not paletted, use original
 
@@ -356,13 +889,12 @@ class MBTilesConverter:
         
 
         try:
-            import shutil
             import tempfile
 
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Find gdal2tiles.py
-            gdal2tiles = shutil.which("gdal2tiles.py") or shutil.which("gdal2tiles")
+            gdal2tiles = _find_gdal2tiles()
             if not gdal2tiles:
                 
                 return False
@@ -399,33 +931,28 @@ class MBTilesConverter:
                     "--xyz",  # Use XYZ tile numbering (OSM Slippy Map)
                     "--srcnodata",
                     "0,0,0,0",
-                    "-v",  # Verbose mode to show progress
-                    str(input_geotiff),
-                    str(temp_tiles_path),
+                    f"--processes={os.cpu_count() or 1}",
                 ]
+                if self.verbose:
+                    cmd.append("-v")  # one line per tile; only worth it when verbose
+                cmd += [str(input_geotiff), str(temp_tiles_path)]
 
                 
 
-                # Run with timeout and capture output
+                # Run with timeout, streaming output so only the tail is held
                 # Use longer timeout for large files (up to 2 hours for very large charts)
-                result = subprocess.run(
-                    cmd, capture_output=True, text=True, timeout=7200
-                )
+                returncode, output_lines = _run_streamed(cmd, timeout=7200)
                 
                 # Show last few lines of output for debugging
-                if result.stdout:
-                    output_lines = result.stdout.strip().split('\n')
-                    # Show last 5 lines
-                    for line in output_lines[-5:]:
-                        if line.strip():
-                            console.print(f"[dim]{line}[/dim]")
+                # Show last 5 lines
+                for line in output_lines[-5:]:
+                    if line.strip():
+                        console.print(f"[dim]{line}[/dim]")
 
                 
 
-                if result.returncode != 0:
-                    console.print(
-                        f"[red]gdal2tiles.py failed: {result.stderr}[/red]"
-                    )
+                if returncode != 0:
+                    console.print("[red]gdal2tiles.py failed[/red]")
                     return False
 
                 # Convert tile directory to mbtiles
@@ -455,8 +982,7 @@ class MBTilesConverter:
         Returns:
             True if successful, False otherwise
         """
-        
-
+        conn = None
         try:
             from osgeo import gdal, osr
 
@@ -482,10 +1008,14 @@ class MBTilesConverter:
             src_srs.ImportFromWkt(projection)
             tgt_srs = osr.SpatialReference()
             tgt_srs.ImportFromEPSG(4326)  # WGS84
+            # GDAL 3+ follows the EPSG axis order (lat, lon for 4326) unless
+            # told otherwise; we want x/lon first on both sides
+            src_srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+            tgt_srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
             
             transform = osr.CoordinateTransformation(src_srs, tgt_srs)
             
-            # Transform corners to WGS84
+            # Transform corners to WGS84 in one call
             corners = [
                 (min_x, min_y),  # bottom-left
                 (max_x, min_y),  # bottom-right
@@ -493,10 +1023,7 @@ class MBTilesConverter:
                 (min_x, max_y),  # top-left
             ]
             
-            wgs84_corners = []
-            for x, y in corners:
-                lon, lat, _ = transform.TransformPoint(x, y)
-                wgs84_corners.append((lon, lat))
+            wgs84_corners = transform.TransformPoints(corners)
             
             # Get min/max lon and lat
             min_lon = min(c[0] for c in wgs84_corners)
@@ -510,35 +1037,9 @@ class MBTilesConverter:
             if output_path.exists():
                 output_path.unlink()
 
-            conn = sqlite3.connect(str(output_path))
+            conn = _open_mbtiles_for_bulk_write(output_path)
             cursor = conn.cursor()
 
-            # Create tables
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS tiles (
-                    zoom_level INTEGER,
-                    tile_column INTEGER,
-                    tile_row INTEGER,
-                    tile_data BLOB
-                )
-            """
-            )
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS metadata (
-                    name TEXT,
-                    value TEXT
-                )
-            """
-            )
-            cursor.execute(
-                """
-                CREATE UNIQUE INDEX IF NOT EXISTS tile_index 
-                ON tiles (zoom_level, tile_column, tile_row)
-            """
-            )
-
             # Insert metadata
             chart_name = output_path.stem.replace("T_", "").replace("S_", "").replace("terminal_", "").replace("sectional_", "")
             metadata = [
@@ -554,101 +1055,76 @@ class MBTilesConverter:
 
             cursor.executemany("INSERT INTO metadata (name, value) VALUES (?, ?)", metadata)
 
-            # Walk tile directory and insert tiles
-            tile_count = 0
-            alpha_logged = False
-            alpha_by_zoom = {}
-            tile_count_by_zoom = {}
-            size_sum_by_zoom = {}
-            size_count_by_zoom = {}
-            sample_dims_by_zoom = {}
-            dropped_transparent_by_zoom = {}
-            for z_dir in tiles_dir.iterdir():
-                if not z_dir.is_dir() or not z_dir.name.isdigit():
-                    continue
-
-                zoom_level = int(z_dir.name)
-                if zoom_level < self.min_zoom or zoom_level > self.max_zoom:
-                    continue
-
-                for x_dir in z_dir.iterdir():
-                    if not x_dir.is_dir() or not x_dir.name.isdigit():
+            # Collect tile paths, then decode/re-encode them in parallel.
+            # All database writes stay in this process.
+            # One scandir pass per directory; DirEntry caches the type so
+            # is_dir()/is_file() need no extra stat calls
+            tile_jobs = []
+            with os.scandir(tiles_dir) as z_entries:
+                for z_entry in z_entries:
+                    if not z_entry.name.isdigit() or not z_entry.is_dir():
                         continue
 
-                    tile_column = int(x_dir.name)
-
-                    for tile_file in list(x_dir.glob("*.png")) + list(x_dir.glob("*.jpg")) + list(x_dir.glob("*.jpeg")):
-                        stem = tile_file.stem
-                        if not stem.isdigit():
-                            continue
+                    zoom_level = int(z_entry.name)
+                    if zoom_level < self.min_zoom or zoom_level > self.max_zoom:
+                        continue
 
-                        tile_row = int(stem)
+                    # gdal2tiles with --xyz uses OSM convention, mbtiles uses TMS
+                    # TMS Y = (2^zoom - 1) - OSM Y
+                    tms_row_max = (1 << zoom_level) - 1
 
-                        # Read tile data
-                        with open(tile_file, "rb") as f:
-                            raw_data = f.read()
+                    with os.scandir(z_entry.path) as x_entries:
+                        for x_entry in x_entries:
+                            if not x_entry.name.isdigit() or not x_entry.is_dir():
+                                continue
 
-                        tile_data = raw_data
-                        if compress_jpeg:
-                            try:
-                                from PIL import Image
-                                import io
-
-                                img = Image.open(io.BytesIO(raw_data))
-                                has_alpha = "A" in img.getbands()
-                                # Count tiles with/without alpha per zoom
-                                tile_count_by_zoom[zoom_level] = tile_count_by_zoom.get(zoom_level, 0) + 1
-                                if has_alpha:
-                                    alpha_by_zoom[zoom_level] = alpha_by_zoom.get(zoom_level, 0) + 1
-
-                                # Track size info per zoom
-                                size_sum_by_zoom[zoom_level] = size_sum_by_zoom.get(zoom_level, 0) + len(raw_data)
-                                size_count_by_zoom[zoom_level] = size_count_by_zoom.get(zoom_level, 0) + 1
-                                if zoom_level not in sample_dims_by_zoom:
-                                    sample_dims_by_zoom[zoom_level] = {"w": img.width, "h": img.height}
-
-                                if has_alpha:
-                                    # Detect fully transparent tiles and skip them
-                                    if img.mode != "RGBA":
-                                        img = img.convert("RGBA")
-                                    extrema = img.getchannel("A").getextrema()
-                                    fully_transparent = extrema == (0, 0)
-                                    if fully_transparent:
-                                        dropped_transparent_by_zoom[zoom_level] = (
-                                            dropped_transparent_by_zoom.get(zoom_level, 0) + 1
+                            tile_column = int(x_entry.name)
+
+                            with os.scandir(x_entry.path) as tile_entries:
+                                for tile_entry in tile_entries:
+                                    stem, dot, suffix = tile_entry.name.rpartition(".")
+                                    if (
+                                        not dot
+                                        or suffix not in ("png", "jpg", "jpeg")
+                                        or not stem.isdigit()
+                                        or not tile_entry.is_file()
+                                    ):
+                                        continue
+
+                                    tile_jobs.append(
+                                        (
+                                            tile_entry.path,
+                                            zoom_level,
+                                            tile_column,
+                                            tms_row_max - int(stem),
+                                            compress_jpeg,
+                                            jpeg_quality,
                                         )
-                                        continue  # skip inserting this tile
-
-                                    if not alpha_logged:
-                                        
-                                        alpha_logged = True
-                                    # keep PNG to preserve transparency
-                                    tile_data = raw_data
-                                else:
-                                    img = img.convert("RGB")
-                                    buf = io.BytesIO()
-                                    img.save(buf, format="JPEG", quality=jpeg_quality, optimize=True)
-                                    tile_data = buf.getvalue()
-                            except Exception:
-                                tile_data = raw_data  # fallback to original
-
-                        # Insert tile (using TMS Y coordinate - need to flip)
-                        # gdal2tiles with --xyz uses OSM convention, mbtiles uses TMS
-                        # TMS Y = (2^zoom - 1) - OSM Y
-                        tms_tile_row = (2**zoom_level - 1) - tile_row
-
-                        cursor.execute(
-                            """
-                            INSERT OR REPLACE INTO tiles 
-                            (zoom_level, tile_column, tile_row, tile_data)
-                            VALUES (?, ?, ?, ?)
-                        """,
-                            (zoom_level, tile_column, tms_tile_row, tile_data),
-                        )
-                        tile_count += 1
+                                    )
 
-            conn.commit()
-            conn.close()
+            tile_count = 0
+            batch = []
+            workers = self.tile_workers
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers, initializer=_recode_worker_init
+            ) as executor:
+                for zoom_level, tile_column, tms_tile_row, tile_data in _imap_unordered(
+                    executor,
+                    _recode_tile,
+                    tile_jobs,
+                    chunksize=max(1, min(512, len(tile_jobs) // (workers * 8))),
+                    window=workers * 4,
+                ):
+                    if tile_data is None:
+                        continue  # fully transparent
+
+                    batch.append((zoom_level, tile_column, tms_tile_row, tile_data))
+                    tile_count += 1
+                    if len(batch) >= TILE_BATCH_SIZE:
+                        _write_tile_batch(conn, batch)
+
+            _write_tile_batch(conn, batch)
+            _finish_mbtiles_bulk_write(conn)
 
             src_ds = None
 
@@ -668,123 +1144,17 @@ class MBTilesConverter:
             console.print(f"[red]Error converting tiles to mbtiles: {e}[/red]")
             
             return False
-
-    def convert_with_gdal_translate(
-        self, geotiff_path: Path, output_path: Path
-    ) -> bool:
-        """Convert GeoTIFF to mbtiles using gdal_translate.
-
-        Args:
-            geotiff_path: Path to input GeoTIFF file
-            output_path: Path to output mbtiles file
-
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # First, create a VRT for better control
-            vrt_path = output_path.with_suffix(".vrt")
-            vrt_cmd = ["gdal_translate", "-of", "VRT", str(geotiff_path), str(vrt_path)]
-
-            result = subprocess.run(vrt_cmd, capture_output=True, text=True, timeout=300)
-            if result.returncode != 0:
-                console.print(f"[red]Failed to create VRT: {result.stderr}[/red]")
-                return False
-
-            # Then use gdal2mbtiles or gdal_translate to mbtiles
-            # Try gdal_translate directly to mbtiles format
-            cmd = [
-                "gdal_translate",
-                "-of",
-                "MBTiles",
-                "-co",
-                f"ZOOM_LEVEL={self.min_zoom}-{self.max_zoom}",
-                str(geotiff_path),
-                str(output_path),
-            ]
-
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=3600
-            )
-
-            # Clean up VRT
-            if vrt_path.exists():
-                vrt_path.unlink()
-
-            if result.returncode == 0:
-                return True
-            else:
-                console.print(
-                    f"[red]gdal_translate failed: {result.stderr}[/red]"
-                )
-                return False
-
-        except subprocess.TimeoutExpired:
-            console.print("[red]Conversion timed out[/red]")
-            return False
-        except Exception as e:
-            console.print(f"[red]Error converting with gdal_translate: {e}[/red]")
-            return False
-
-    def convert_with_python_gdal(
-        self, geotiff_path: Path, output_path: Path
-    ) -> bool:
-        """Convert GeoTIFF to mbtiles using Python GDAL bindings.
-
-        Args:
-            geotiff_path: Path to input GeoTIFF file
-            output_path: Path to output mbtiles file
-
-        Returns:
-            True if successful, False otherwise
-        """
-        
-
-        try:
-            from osgeo import gdal
-
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Open the GeoTIFF
-            src_ds = gdal.Open(str(geotiff_path))
-            if src_ds is None:
-                console.print(f"[red]Failed to open GeoTIFF: {geotiff_path}[/red]")
-                
-                return False
-
-            
-
-            # Create mbtiles driver
-            driver = gdal.GetDriverByName("MBTiles")
-            if driver is None:
-                console.print("[red]MBTiles driver not available[/red]")
-                
-                return False
-
-            # GDAL MBTiles driver does NOT support ZOOM_LEVEL option (as confirmed by warning)
-            # We need to use a different approach - skip CreateCopy and use gdal2tiles instead
-            
-            # Return False to fall back to gdal2tiles method
-            return False
-
-        except ImportError:
-            console.print(
-                "[yellow]Python GDAL bindings not available, trying alternative methods[/yellow]"
-            )
-            
-            return False
-        except Exception as e:
-            console.print(f"[red]Error converting with Python GDAL: {e}[/red]")
-            
-            return False
+        finally:
+            if conn is not None:
+                conn.close()
 
     def _convert_with_rio_tiler(self, geotiff_path: Path, output_path: Path, verbose: bool = False) -> bool:
         """Convert GeoTIFF to mbtiles using rio-tiler with a temp COG (overviews) and progress."""
         # Quick inspection to catch palette/scale issues before conversion
         self._inspect_geotiff_quick(geotiff_path)
 
+        conn = None
+        cog = None
         try:
             # Suppress noisy warnings from GDAL/rio-cogeo/rio-tiler that don't affect output
             with warnings.catch_warnings():
@@ -845,8 +1215,11 @@ class MBTilesConverter:
                         str(temp_cog_path),
                         profile,
                         nodata=0,
-                        overview_level=5,
+                        # One overview per zoom below max_zoom, so low zooms
+                        # read a matching overview rather than a finer one
+                        overview_level=max(self.max_zoom - self.min_zoom, 5),
                         overview_resampling="average",
+                        config={"GDAL_NUM_THREADS": str(self.gdal_threads or "ALL_CPUS")},
                         quiet=True,
                     )
                     
@@ -857,38 +1230,42 @@ class MBTilesConverter:
                     base_tiles = []
                     valid_base: set[tuple[int, int]] = set()
                     
-                    with COGReader(str(temp_cog_path), tms=tms) as cog:
-                        # Get bounds in dataset CRS
-                        dataset_bounds = cog.bounds
-                        dataset_crs = cog.dataset.crs
-                        
-                        # CRITICAL FIX: Convert bounds to WGS84 (lat/lon) for ForeFlight
-                        # cog.bounds returns bounds in the dataset's native CRS, not necessarily WGS84
-                        from rasterio.warp import transform_bounds
-                        bounds_wgs84 = transform_bounds(
-                            dataset_crs,
-                            "EPSG:4326",  # WGS84
-                            dataset_bounds[0],  # minx
-                            dataset_bounds[1],  # miny
-                            dataset_bounds[2],  # maxx
-                            dataset_bounds[3],  # maxy
+                    # Opened once here for bounds and base-tile sampling, then
+                    # handed to a worker thread instead of being reopened
+                    cog = COGReader(str(temp_cog_path), tms=tms)
+                    # Get bounds in dataset CRS
+                    dataset_bounds = cog.bounds
+                    dataset_crs = cog.dataset.crs
+                    
+                    # CRITICAL FIX: Convert bounds to WGS84 (lat/lon) for ForeFlight
+                    # cog.bounds returns bounds in the dataset's native CRS, not necessarily WGS84
+                    bounds_wgs84 = transform_bounds(
+                        dataset_crs, "EPSG:4326", *dataset_bounds  # WGS84
+                    )
+                    
+                    # Build a filtered tile list: sample at min_zoom to find tiles with data,
+                    # then expand only those tiles across higher zooms. This avoids wasting
+                    # time on large transparent areas.
+                    base_tiles = list(
+                        tms.tiles(
+                            bounds_wgs84[0],
+                            bounds_wgs84[1],
+                            bounds_wgs84[2],
+                            bounds_wgs84[3],
+                            zooms=[base_zoom],
                         )
-                        
-                        # Build a filtered tile list: sample at min_zoom to find tiles with data,
-                        # then expand only those tiles across higher zooms. This avoids wasting
-                        # time on large transparent areas.
-                        base_tiles = list(
-                            tms.tiles(
-                                bounds_wgs84[0],
-                                bounds_wgs84[1],
-                                bounds_wgs84[2],
-                                bounds_wgs84[3],
-                                zooms=[base_zoom],
-                            )
+                    )
+                    
+                    # Filter tiles by checking alpha channel while COGReader is still open
+                    tile_size = self.tile_size
+                    try:
+                        valid_base = _base_tiles_with_data(
+                            cog, tms, base_tiles, base_zoom, tile_size, alpha_threshold
                         )
-                        
-                        # Filter tiles by checking alpha channel while COGReader is still open
-                        tile_size = self.tile_size
+                    except Exception as e:
+                        # Fall back to sampling tile by tile
+                        if verbose:
+                            console.print(f"[yellow]Warning: Block read of base tiles failed ({e}), sampling per tile[/yellow]")
                         for base_tile in base_tiles:
                             try:
                                 _, base_mask = cog.tile(base_tile.x, base_tile.y, base_zoom, tilesize=tile_size)
@@ -900,67 +1277,84 @@ class MBTilesConverter:
                                 if verbose:
                                     console.print(f"[yellow]Warning: Failed to read tile ({base_tile.x}, {base_tile.y}) at zoom {base_zoom}: {e}[/yellow]")
                                 continue
-                    
+
                     # If no valid base tiles found, try processing all tiles anyway (maybe threshold is too strict)
                     if len(valid_base) == 0 and len(base_tiles) > 0:
                         if verbose:
                             console.print("[yellow]Warning: No tiles passed alpha threshold, processing all tiles anyway[/yellow]")
                         valid_base = {(t.x, t.y) for t in base_tiles}
 
-                    tiles_list = []
-                    for z in range(self.min_zoom, self.max_zoom + 1):
-                        if z == base_zoom:
-                            for bx, by in valid_base:
-                                tiles_list.append((bx, by, z))
-                        else:
-                            scale = 2 ** (z - base_zoom)
-                            for bx, by in valid_base:
-                                start_x = bx * scale
-                                start_y = by * scale
-                                for dx in range(scale):
-                                    for dy in range(scale):
-                                        tiles_list.append((start_x + dx, start_y + dy, z))
-
-                    conn = sqlite3.connect(str(output_path))
-                    cursor = conn.cursor()
-                    cursor.execute("PRAGMA journal_mode=MEMORY;")
-                    cursor.execute("PRAGMA synchronous=OFF;")
-                    cursor.execute("PRAGMA temp_store=MEMORY;")
-                    cursor.execute("PRAGMA cache_size=-50000;")
-                    cursor.execute(
-                        """
-                        CREATE TABLE IF NOT EXISTS tiles (
-                            zoom_level INTEGER,
-                            tile_column INTEGER,
-                            tile_row INTEGER,
-                            tile_data BLOB
-                        )
-                    """
-                    )
-                    cursor.execute(
-                        """
-                        CREATE TABLE IF NOT EXISTS metadata (
-                            name TEXT,
-                            value TEXT
-                        )
-                    """
-                    )
-                    cursor.execute(
-                        """
-                        CREATE UNIQUE INDEX IF NOT EXISTS tile_index 
-                        ON tiles (zoom_level, tile_column, tile_row)
-                    """
-                    )
+                    # Fan each base tile out to its children at every zoom
+                    # with NumPy broadcasting: (base, dx, dy) -> x, y. Rows are
+                    # (x, y, z) in one int32 array rather than a list of tuples.
+                    base_xy = np.array(list(valid_base), dtype=np.int32).reshape(-1, 2)
+                    zooms = range(self.min_zoom, self.max_zoom + 1)
+                    total_tiles = sum(len(base_xy) << (2 * (z - base_zoom)) for z in zooms)
+                    tiles_list = np.empty((total_tiles, 3), dtype=np.int32)
+                    row = 0
+                    for z in zooms:
+                        scale = 1 << (z - base_zoom)
+                        offsets = np.arange(scale, dtype=np.int32)
+                        count = len(base_xy) * scale * scale
+                        block = tiles_list[row:row + count].reshape(len(base_xy), scale, scale, 3)
+                        block[..., 0] = base_xy[:, 0, None, None] * scale + offsets[None, :, None]
+                        block[..., 1] = base_xy[:, 1, None, None] * scale + offsets[None, None, :]
+                        block[..., 2] = z
+                        row += count
+
+                    # Tree jobs start at overview_zoom (see OVERVIEW_DEPTH). Check
+                    # each base tile's descendants there the same way and drop
+                    # the empty ones with their subtrees, e.g. the blank
+                    # corners of a chart's bounding box. Skipped when the
+                    # block read per base tile would get too large.
+                    overview_zoom = max(self.min_zoom, self.max_zoom - OVERVIEW_DEPTH)
+                    scale = 1 << (overview_zoom - base_zoom)
+                    if 1 < scale <= 32:
+                        covered = set()
+                        try:
+                            for base_x, base_y in valid_base:
+                                covered |= _base_tiles_with_data(
+                                    cog,
+                                    tms,
+                                    [
+                                        morecantile.Tile(base_x * scale + i, base_y * scale + j, overview_zoom)
+                                        for i in range(scale)
+                                        for j in range(scale)
+                                    ],
+                                    overview_zoom,
+                                    tile_size,
+                                    alpha_threshold,
+                                )
+                        except Exception as e:
+                            if verbose:
+                                console.print(f"[yellow]Warning: Coverage check at zoom {overview_zoom} failed ({e}), keeping all tiles[/yellow]")
+                            covered = set()
+                        if covered:
+                            shift = tiles_list[:, 2] - overview_zoom
+                            deep = shift >= 0
+                            ancestor_x = tiles_list[deep, 0] >> shift[deep]
+                            ancestor_y = tiles_list[deep, 1] >> shift[deep]
+                            covered_keys = np.array(
+                                [(x << 32) | y for x, y in covered], dtype=np.int64
+                            )
+                            keep = np.ones(len(tiles_list), dtype=bool)
+                            keep[deep] = np.isin(
+                                (ancestor_x.astype(np.int64) << 32) | ancestor_y, covered_keys
+                            )
+                            tiles_list = tiles_list[keep]
+
+                    # Unique index is built after the load by _finish_mbtiles_bulk_write.
+                    # Small outputs are built in RAM and copied to disk at the end.
+                    # 1 byte/pixel is only a heuristic (chart tiles compress to
+                    # well under that, but a noisy RGBA PNG can reach 4), so the
+                    # bytes actually written are tracked and the load moves to
+                    # disk once they pass the budget.
+                    in_memory = len(tiles_list) * tile_size * tile_size <= MEMORY_DB_BUDGET_BYTES
+                    conn = _open_mbtiles_for_bulk_write(output_path, in_memory=in_memory)
+                    payload_bytes = 0
 
-                    alpha_by_zoom: Dict[int, int] = {}
-                    tile_count_by_zoom: Dict[int, int] = {}
-                    dropped_transparent_by_zoom: Dict[int, int] = {}
-                    size_sum_by_zoom: Dict[int, int] = {}
-                    size_count_by_zoom: Dict[int, int] = {}
-                    sample_dims_by_zoom: Dict[int, Dict[str, int]] = {}
                     tile_count = 0
-                    alpha_logged = False
-                    commit_interval = 500
+                    batch = []
 
                     # Tile-level progress display
                     if verbose:
@@ -994,75 +1388,101 @@ class MBTilesConverter:
                         
                         progress = progress_display
 
-                        workers = max(2, (os.cpu_count() or 1) - 2)
+                        workers = self.tile_workers
                         if verbose:
                             console.print(f"Using {workers} cores")
                         tile_size = self.tile_size
-                        with concurrent.futures.ProcessPoolExecutor(
+                        # XYZ -> TMS row flip, (2^z - 1) - y, precomputed per zoom
+                        tms_row_max = [(1 << z) - 1 for z in range(self.max_zoom + 1)]
+                        # Threads by default: rasterio reads and the encoders
+                        # release the GIL, and tile bytes need no pickling
+                        if self.use_processes:
+                            # Readers cannot cross process boundaries
+                            executor_class = concurrent.futures.ProcessPoolExecutor
+                            initargs = (str(temp_cog_path), "WebMercatorQuad")
+                        else:
+                            executor_class = concurrent.futures.ThreadPoolExecutor
+                            open_readers = queue.SimpleQueue()
+                            open_readers.put(cog)
+                            initargs = (str(temp_cog_path), "WebMercatorQuad", open_readers)
+                        with executor_class(
                             max_workers=workers,
                             initializer=_worker_init,
-                            initargs=(str(temp_cog_path), "WebMercatorQuad"),
-                        ) as executor:
-                            for result in executor.map(
-                                _worker_process_tile,
-                                ((x, y, z, alpha_threshold, tile_size) for (x, y, z) in tiles_list),
-                                chunksize=32,
-                            ):
+                            initargs=initargs,
+                        ) as executor, (
+                            contextlib.nullcontext()
+                            if self.use_processes  # workers close theirs on exit
+                            else _closing_worker_readers(executor, workers)
+                        ):
+                            # Zooms below overview_zoom are read from the COG tile
+                            # by tile; each tile at overview_zoom is one job that
+                            # reads its max_zoom descendants and averages upward
+                            zoom_column = tiles_list[:, 2]
+                            single_rows = tiles_list[zoom_column < overview_zoom]
+                            tree_rows = tiles_list[zoom_column == overview_zoom]
+                            # Pool.map's heuristic, capped: small charts still
+                            # spread over every worker, big ones amortize the
+                            # per-chunk overhead. Tree jobs are ~85 tiles each,
+                            # so they go one per chunk in a smaller window.
+                            chunksize = max(1, min(512, len(single_rows) // (workers * 8)))
+                            results = itertools.chain(
+                                _imap_unordered(
+                                    executor,
+                                    _worker_process_tile,
+                                    (
+                                        (x, y, z, z, alpha_threshold, tile_size)
+                                        for x, y, z in _iter_rows(single_rows)
+                                    ),
+                                    chunksize=chunksize,
+                                    window=workers * 4,
+                                ),
+                                _imap_unordered(
+                                    executor,
+                                    _worker_process_tile,
+                                    (
+                                        (x, y, z, self.max_zoom, alpha_threshold, tile_size)
+                                        for x, y, z in _iter_rows(tree_rows)
+                                    ),
+                                    chunksize=1,
+                                    window=workers * 2,
+                                ),
+                            )
+                            # Progress is advanced at most ~10 times a second
+                            # rather than once per tile
+                            unreported = 0
+                            last_report = time.monotonic()
+                            for result in itertools.chain.from_iterable(results):
+                                if task is not None:
+                                    unreported += 1
+                                    now = time.monotonic()
+                                    if now - last_report >= 0.1:
+                                        progress.advance(task, unreported)
+                                        unreported = 0
+                                        last_report = now
+
                                 if result is None:
-                                    if verbose and task is not None:
-                                        progress.advance(task)
                                     continue
 
                                 status, z, x, y, tile_data_bytes, has_alpha, err = result
 
-                                if status == "error":
-                                    if verbose and task is not None:
-                                        progress.advance(task)
-                                    continue
-
-                                if status == "dropped":
-                                    dropped_transparent_by_zoom[z] = (
-                                        dropped_transparent_by_zoom.get(z, 0) + 1
-                                    )
-                                    if verbose and task is not None:
-                                        progress.advance(task)
-                                    continue
-
-                                tile_count_by_zoom[z] = tile_count_by_zoom.get(z, 0) + 1
-                                if has_alpha:
-                                    alpha_by_zoom[z] = alpha_by_zoom.get(z, 0) + 1
-                                    if not alpha_logged:
-                                        alpha_logged = True
-
-                                size_count_by_zoom[z] = size_count_by_zoom.get(z, 0) + 1
-                                if z not in sample_dims_by_zoom:
-                                    sample_dims_by_zoom[z] = {"w": tile_size, "h": tile_size}
-
-                                if tile_data_bytes is None:
-                                    if verbose and task is not None:
-                                        progress.advance(task)
+                                # Errors (e.g. tiles outside the COG) and fully
+                                # transparent tiles are skipped
+                                if status != "ok" or tile_data_bytes is None:
                                     continue
 
-                                size_sum_by_zoom[z] = size_sum_by_zoom.get(z, 0) + len(
-                                    tile_data_bytes
-                                )
-
-                                tms_y = (2**z - 1) - y
-                                cursor.execute(
-                                    """
-                                    INSERT OR REPLACE INTO tiles 
-                                    (zoom_level, tile_column, tile_row, tile_data)
-                                    VALUES (?, ?, ?, ?)
-                                """,
-                                    (z, x, tms_y, tile_data_bytes),
-                                )
+                                batch.append((z, x, tms_row_max[z] - y, tile_data_bytes))
                                 tile_count += 1
-                                if tile_count % commit_interval == 0:
-                                    conn.commit()
-                                if verbose and task is not None:
-                                    progress.advance(task)
+                                payload_bytes += len(tile_data_bytes)
+                                if len(batch) >= TILE_BATCH_SIZE:
+                                    _write_tile_batch(conn, batch)
+                                    if in_memory and payload_bytes > MEMORY_DB_BUDGET_BYTES:
+                                        conn = _spill_mbtiles_to_disk(conn, output_path)
+                                        in_memory = False
+
+                            if task is not None:
+                                progress.advance(task, unreported)
 
-                    conn.commit()
+                    _write_tile_batch(conn, batch)
 
                     metadata = [
                         ("name", output_path.stem.replace("T_", "").replace("S_", "").replace("terminal_", "").replace("sectional_", "")),
@@ -1084,9 +1504,8 @@ class MBTilesConverter:
                         ("minzoom", str(self.min_zoom)),
                         ("maxzoom", str(self.max_zoom)),
                     ]
-                    cursor.executemany("INSERT INTO metadata (name, value) VALUES (?, ?)", metadata)
-                    conn.commit()
-                    conn.close()
+                    conn.executemany("INSERT INTO metadata (name, value) VALUES (?, ?)", metadata)
+                    _finish_mbtiles_bulk_write(conn, backup_to=output_path if in_memory else None)
 
                     
 
@@ -1101,6 +1520,13 @@ class MBTilesConverter:
         except Exception as e:
             console.print(f"[red]Error converting with rio-tiler: {e}[/red]")
             return False
+        finally:
+            # The writer holds an exclusive lock; release it even on failure
+            # (closing an already closed connection is a no-op)
+            if conn is not None:
+                conn.close()
+            if cog is not None:
+                cog.close()
 
     def convert(self, geotiff_path: Path, output_path: Path, verbose: Optional[bool] = None) -> bool:
         """Convert GeoTIFF to mbtiles using available method.
@@ -1139,6 +1565,19 @@ class MBTilesConverter:
             console.print(
                 "[red]Conversion failed with rio-tiler[/red]"
             )
+
+        # Fallback: gdal2tiles.py, when the GDAL command-line tools are installed
+        if self._check_gdal2tiles_available():
+            if verbose:
+                console.print("[cyan]Retrying with gdal2tiles.py...[/cyan]")
+            if self.convert_with_gdal2tiles(geotiff_path, output_path):
+                if verbose:
+                    console.print("[green]Converted using gdal2tiles.py[/green]")
+                if self._verify_mbtiles(output_path):
+                    if self._verify_and_fix_zoom_levels(output_path):
+                        return True
+            if verbose:
+                console.print("[red]Conversion failed with gdal2tiles.py[/red]")
         
         return False
 
@@ -1308,6 +1747,9 @@ class MBTilesConverter:
             output_dir: Directory for output mbtiles files
             chart_type_label: Label for the chart type (e.g., "Sectional charts", "Terminal charts")
 
+        Without verbose output, charts are converted several at a time in
+        worker processes when chart_parallel is on.
+
         Returns:
             List of charts with added mbtiles_path field
         """
@@ -1337,14 +1779,8 @@ class MBTilesConverter:
                     chart_name = chart["chart_name"]
                     progress.update(task, description=f"Converting {chart_name}")
 
-                    # Generate mbtiles filename with short prefix
-                    safe_name = self._sanitize_filename(chart_name)
-                    chart_type = chart.get("chart_type", "unknown")
-                    # Use short prefixes: T_ for terminal, S_ for sectional
-                    prefix_map = {"terminal": "T", "sectional": "S"}
-                    prefix = prefix_map.get(chart_type, chart_type[:1].upper())
-                    mbtiles_filename = f"{prefix}_{safe_name}.mbtiles"
-                    mbtiles_path = output_dir / mbtiles_filename
+                    mbtiles_path = self._mbtiles_path(chart, output_dir)
+                    mbtiles_filename = mbtiles_path.name
 
                     # Convert
                     if self.convert(geotiff_path, mbtiles_path, verbose=self.verbose):
@@ -1374,36 +1810,86 @@ class MBTilesConverter:
                     status=""
                 )
 
-                for idx, chart in enumerate(charts):
+                pending = []
+                for chart in charts:
                     geotiff_path = Path(chart.get("geotiff_path", ""))
                     if not geotiff_path.exists():
                         progress.update(task, status=f"[yellow]Skipping {chart.get('chart_name', 'unknown')}[/yellow]")
                         progress.advance(task)
                         continue
+                    pending.append((chart, geotiff_path, self._mbtiles_path(chart, output_dir)))
 
-                    chart_name = chart["chart_name"]
-                    progress.update(task, status=chart_name)
-
-                    # Generate mbtiles filename with short prefix
-                    safe_name = self._sanitize_filename(chart_name)
-                    chart_type = chart.get("chart_type", "unknown")
-                    # Use short prefixes: T_ for terminal, S_ for sectional
-                    prefix_map = {"terminal": "T", "sectional": "S"}
-                    prefix = prefix_map.get(chart_type, chart_type[:1].upper())
-                    mbtiles_filename = f"{prefix}_{safe_name}.mbtiles"
-                    mbtiles_path = output_dir / mbtiles_filename
-
-                    # Convert (suppress output in non-verbose mode)
-                    if self.convert(geotiff_path, mbtiles_path, verbose=False):
+                # Success comes from convert()'s return value, not from an
+                # mbtiles_path the input chart may already carry
+                succeeded = [False] * len(pending)
+
+                def finish(index: int, ok: bool) -> None:
+                    chart, _, mbtiles_path = pending[index]
+                    succeeded[index] = ok
+                    if ok:
                         chart["mbtiles_path"] = str(mbtiles_path)
-                        charts_with_mbtiles.append(chart)
                     else:
-                        progress.update(task, status=f"[red]Failed: {chart_name}[/red]")
-
+                        progress.update(task, status=f"[red]Failed: {chart['chart_name']}[/red]")
                     progress.advance(task)
 
+                cpus = os.cpu_count() or 1
+                chart_workers = min(len(pending), MAX_PARALLEL_CHARTS, cpus)
+                if self.chart_parallel and chart_workers > 1:
+                    # Independent charts overlap each other's single-threaded
+                    # phases (index build, MBTiles write); the cores are split
+                    # between them so GDAL and the tile pools do not oversubscribe
+                    tile_workers = max(2, cpus // chart_workers)
+                    gdal_threads = max(1, cpus // chart_workers)
+                    # Spawned, not forked: the progress bar's refresh thread
+                    # (and any GDAL threads) are running in this process
+                    with concurrent.futures.ProcessPoolExecutor(
+                        max_workers=chart_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    ) as executor:
+                        futures = {
+                            executor.submit(
+                                _convert_one,
+                                (
+                                    geotiff_path,
+                                    mbtiles_path,
+                                    self.min_zoom,
+                                    self.max_zoom,
+                                    self.use_processes,
+                                    tile_workers,
+                                    gdal_threads,
+                                ),
+                            ): index
+                            for index, (chart, geotiff_path, mbtiles_path) in enumerate(pending)
+                        }
+                        progress.update(task, status=f"{chart_workers} charts at a time")
+                        for future in concurrent.futures.as_completed(futures):
+                            try:
+                                ok = future.result()
+                            except Exception:
+                                ok = False
+                            finish(futures[future], ok)
+                else:
+                    for index, (chart, geotiff_path, mbtiles_path) in enumerate(pending):
+                        progress.update(task, status=chart["chart_name"])
+                        # Convert (suppress output in non-verbose mode)
+                        finish(index, self.convert(geotiff_path, mbtiles_path, verbose=False))
+
+                # Keep the input order regardless of completion order
+                charts_with_mbtiles = [
+                    chart for (chart, _, _), ok in zip(pending, succeeded) if ok
+                ]
+
         return charts_with_mbtiles
 
+    def _mbtiles_path(self, chart: dict, output_dir: Path) -> Path:
+        """Build the output path for a chart, with a short chart type prefix."""
+        safe_name = self._sanitize_filename(chart["chart_name"])
+        chart_type = chart.get("chart_type", "unknown")
+        # Use short prefixes: T_ for terminal, S_ for sectional
+        prefix_map = {"terminal": "T", "sectional": "S"}
+        prefix = prefix_map.get(chart_type, chart_type[:1].upper())
+        return output_dir / f"{prefix}_{safe_name}.mbtiles"
+
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for filesystem.
 
@@ -54,34 +54,43 @@ class PDFGenerator:
 
         return filename
 
-
+    def get_output_path(self, chart_info: Dict) -> Path:
+        """Return the path the chart's BYOP PDF is written to."""
+        return self.output_dir / "byop" / self.generate_byop_filename(chart_info)
 
     def image_to_pdf(self, image_data: bytes, output_path: Path) -> bool:
         """Convert image data to PDF."""
         try:
-            # Convert image data to PDF
-            pdf_data = img2pdf.convert(image_data)
-
-            # Write PDF to file
+            # Stream the PDF straight into the file instead of building the
+            # whole document in memory first
             with open(output_path, "wb") as f:
-                f.write(pdf_data)
+                img2pdf.convert(image_data, outputstream=f)
 
             return True
 
         except Exception as e:
             console.print(f"[red]Error converting image to PDF: {e}[/red]")
+            # Don't leave a truncated PDF behind for ForeFlight to pick up
+            output_path.unlink(missing_ok=True)
             return False
 
-    def process_chart(self, chart_info: Dict, image_data: bytes) -> Optional[Path]:
-        """Process a single chart and generate PDF."""
+    def process_chart(
+        self, chart_info: Dict, image_data: bytes, verbose: bool = True
+    ) -> Optional[Path]:
+        """Process a single chart and generate PDF.
+
+        With ``verbose=False`` the per-chart "Generated" line is skipped;
+        failures are always reported.
+        """
         try:
             # Generate BYOP filename
-            filename = self.generate_byop_filename(chart_info)
-            output_path = self.output_dir / "byop" / filename
+            output_path = self.get_output_path(chart_info)
+            filename = output_path.name
 
             # Convert image to PDF
             if self.image_to_pdf(image_data, output_path):
-                console.print(f"[green]Generated:[/green] {filename}")
+                if verbose:
+                    console.print(f"[green]Generated:[/green] {filename}")
                 return output_path
             else:
                 console.print(
@@ -113,7 +122,8 @@ class PDFGenerator:
                     task, description=f"Processing {chart_info['icao_code']}"
                 )
 
-                pdf_path = self.process_chart(chart_info, image_data)
+                # The progress bar already shows each chart; only failures print
+                pdf_path = self.process_chart(chart_info, image_data, verbose=False)
                 if pdf_path:
                     key = f"{chart_info['icao_code']}_{chart_info['chart_name']}"
                     successful_pdfs[key] = pdf_path
@@ -19,12 +19,18 @@ console = Console()
 class AIPScraper:
     """Scraper for DFS AIP VFR aerodrome charts."""
 
-    def __init__(self, base_url: str = "https://aip.dfs.de", rate_limit: float = 1.0):
+    def __init__(
+        self,
+        base_url: str = "https://aip.dfs.de",
+        rate_limit: float = 1.0,
+        max_connections: int = 10,
+    ):
         """Initialize the scraper.
 
         Args:
             base_url: Base URL for the AIP service
             rate_limit: Minimum delay between requests in seconds (default: 1.0)
+            max_connections: Keep-alive connections pooled per host (default: 10)
         """
         self.base_url = base_url
         self.rate_limit = rate_limit
@@ -54,6 +60,14 @@ class AIPScraper:
             }
         )
 
+        # Keep enough connections alive that concurrent chart downloads reuse
+        # them instead of opening a new TLS connection per request
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=max_connections, pool_maxsize=max_connections
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def _make_request(
         self, url: str, method: str = "get", **kwargs
     ) -> requests.Response:
@@ -430,9 +444,9 @@ class AIPScraper:
                 if referrer_url:
                     headers["Referer"] = referrer_url
 
-                session.headers.update(headers)
-
-                response = session.get(print_url, timeout=60)
+                # Headers are passed per request rather than written into the
+                # shared session, so concurrent downloads keep their own Referer
+                response = session.get(print_url, headers=headers, timeout=60)
                 response.raise_for_status()
 
                 # Check what we received
@@ -480,7 +494,7 @@ class AIPScraper:
                     ):
                         img_url = urljoin(print_url, src)
 
-                        img_response = session.get(img_url, timeout=60)
+                        img_response = session.get(img_url, headers=headers, timeout=60)
                         img_response.raise_for_status()
 
                         if len(img_response.content) > 1000:  # Valid size check
@@ -509,7 +523,7 @@ class AIPScraper:
                     elif src and len(src) > 10:
                         img_url = urljoin(print_url, src)
 
-                        img_response = session.get(img_url, timeout=60)
+                        img_response = session.get(img_url, headers=headers, timeout=60)
                         img_response.raise_for_status()
 
                         # Check if it's actually an image and substantial size
@@ -752,6 +766,11 @@ class AIPScraper:
         processed_aerodromes = 0
         successful_pdfs = 0
 
+        # The current date is known once the aerodrome list has been fetched;
+        # build the referrer prefix once instead of per chart
+        current_date = getattr(self, "current_date", None)
+        referrer_base = f"{self.base_url}/BasicVFR/{current_date}/"
+
         # Process each section
         for section_idx, (section_name, section_url) in enumerate(sections):
             console.print(
@@ -806,9 +825,9 @@ class AIPScraper:
                         )
 
                         # Build referrer URL
-                        if chart.get("page_url") and hasattr(self, "current_date"):
-                            page_href = chart["page_url"].replace("../", "")
-                            referrer_url = f"{self.base_url}/BasicVFR/{self.current_date}/{page_href}"
+                        chart_page_url = chart.get("page_url")
+                        if chart_page_url and current_date:
+                            referrer_url = referrer_base + chart_page_url.removeprefix("../")
                         else:
                             referrer_url = None
 
@@ -109,6 +109,31 @@ class TestFAAScraper:
         assert "faa.gov" in call_url
         assert "vfr" in call_url.lower()
 
+    @patch('src.faa_scraper.FAAScraper._make_request')
+    def test_get_vfr_page_cached(self, mock_make_request):
+        """
+        Test that the VFR page is only fetched once per scraper.
+        
+        What this test does:
+        - Calls get_vfr_page twice on the same scraper
+        - Verifies that only one HTTP request is made
+        
+        Why this matters:
+        - process-all shares one scraper between Sectional and Terminal charts
+        - Both chart types are listed on the same page
+        """
+        scraper = FAAScraper()
+        
+        mock_response = Mock()
+        mock_response.text = "<html><body>FAA VFR Page</body></html>"
+        mock_make_request.return_value = mock_response
+        
+        first = scraper.get_vfr_page()
+        second = scraper.get_vfr_page()
+        
+        assert first == second == "<html><body>FAA VFR Page</body></html>"
+        mock_make_request.assert_called_once()
+
     def test_extract_sectional_charts(self):
         """
         Test extracting Sectional chart information from HTML.
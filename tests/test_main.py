@@ -0,0 +1,271 @@
+"""
+Tests for the download pipeline in the main CLI module.
+
+The ``download`` command reads chart data written by ``scrape``, fetches every
+chart image and turns it into a BYOP PDF. These tests drive the helpers behind
+it with a fake scraper and a fake PDF generator, so no network access or
+img2pdf is needed.
+
+What is being tested?
+---------------------
+- Saving and loading chart data (plain JSON and ``.zst``)
+- Validation of the required chart keys
+- Fetching each print URL once and handing the image to every chart using it
+- The bounded number of downloads in flight
+- Failed downloads
+- Skipping charts whose PDF already exists, and ``force``
+"""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from src import main
+
+
+class FakeScraper:
+    """Stand-in for AIPScraper that serves chart images from memory."""
+
+    base_url = "https://aip.example"
+    current_date = "2025-01-01"
+
+    def __init__(self, failing_urls=()):
+        self.failing_urls = set(failing_urls)
+        self.requested = []
+        self._lock = threading.Lock()
+
+    def download_chart_image(self, print_url, referrer_url=None):
+        with self._lock:
+            self.requested.append(print_url)
+        if print_url in self.failing_urls:
+            return None
+        return f"image:{print_url}".encode()
+
+
+class FakePDFGenerator:
+    """Stand-in for PDFGenerator that writes the image bytes as the 'PDF'."""
+
+    def __init__(self, output_dir: Path):
+        self.output_dir = output_dir
+        (output_dir / "byop").mkdir(parents=True, exist_ok=True)
+        self.processed = []
+
+    def get_output_path(self, chart: dict) -> Path:
+        return self.output_dir / "byop" / f"{chart['icao_code']}_{chart['chart_name']}.PDF"
+
+    def process_chart(self, chart: dict, image_data: bytes, verbose: bool = True) -> bool:
+        self.get_output_path(chart).write_bytes(image_data)
+        self.processed.append(chart["chart_name"])
+        return True
+
+
+def make_chart(icao: str, name: str, print_url: str) -> dict:
+    return {"icao_code": icao, "chart_name": name, "print_url": print_url}
+
+
+class TestChartData:
+    """Test cases for saving and loading chart data."""
+
+    def test_json_round_trip(self, tmp_path):
+        """
+        Test that chart data survives a save and load as plain JSON.
+
+        Why this matters:
+        - ``scrape --output`` and ``download`` exchange charts through this file
+        """
+        charts = [make_chart("EDDF", "Frankfurt Ä", "https://aip.example/1.png")]
+        path = tmp_path / "charts.json"
+
+        main._save_charts(charts, path)
+
+        assert json.loads(path.read_text(encoding="utf-8")) == charts
+        assert main._load_charts(path) == charts
+
+    def test_zst_round_trip(self, tmp_path):
+        """
+        Test that a ``.zst`` suffix writes compressed data that loads back unchanged.
+        """
+        zstandard = pytest.importorskip("zstandard")
+        charts = [
+            make_chart("EDDF", f"Chart {i}", f"https://aip.example/{i}.png")
+            for i in range(50)
+        ]
+        path = tmp_path / "charts.json.zst"
+
+        main._save_charts(charts, path)
+
+        raw = zstandard.ZstdDecompressor().decompress(path.read_bytes())
+        assert json.loads(raw) == charts
+        assert main._load_charts(path) == charts
+
+    def test_missing_required_key(self, tmp_path):
+        """
+        Test that a chart without one of REQUIRED_CHART_KEYS is rejected up front.
+
+        Why this matters:
+        - A bad file should fail before any download starts, not halfway through
+        """
+        chart = make_chart("EDDF", "Frankfurt", "https://aip.example/1.png")
+        del chart["print_url"]
+        path = tmp_path / "charts.json"
+        path.write_text(json.dumps([chart]), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="print_url"):
+            main._load_charts(path)
+
+    def test_not_a_list(self, tmp_path):
+        """Test that a file that is not a list of charts is rejected."""
+        path = tmp_path / "charts.json"
+        path.write_text(json.dumps({"charts": []}), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="list of charts"):
+            main._load_charts(path)
+
+
+class TestIterChartImages:
+    """Test cases for the concurrent chart image downloads."""
+
+    def test_duplicate_print_urls_fetched_once(self):
+        """
+        Test that charts sharing a print URL are downloaded once.
+
+        What this test does:
+        - Three charts use the same URL, one uses another
+        - Verifies each URL is requested once
+        - Verifies every chart of a group is yielded with the image
+
+        Why this matters:
+        - Several aerodromes can point at the same chart image
+        """
+        charts = [
+            make_chart("EDDF", "A", "https://aip.example/shared.png"),
+            make_chart("EDDS", "B", "https://aip.example/other.png"),
+            make_chart("EDDM", "C", "https://aip.example/shared.png"),
+            make_chart("EDDH", "D", "https://aip.example/shared.png"),
+        ]
+        scraper = FakeScraper()
+
+        results = list(main._iter_chart_images(scraper, charts, workers=2))
+
+        assert sorted(scraper.requested) == [
+            "https://aip.example/other.png",
+            "https://aip.example/shared.png",
+        ]
+        assert len(results) == len(charts)
+        for chart, image_data in results:
+            assert image_data == f"image:{chart['print_url']}".encode()
+        assert {chart["chart_name"] for chart, _ in results} == {"A", "B", "C", "D"}
+
+    def test_downloads_in_flight_are_bounded(self):
+        """
+        Test that no more than two downloads per worker run ahead of the consumer.
+
+        Why this matters:
+        - Finished images are held in memory until the consumer writes their
+          PDF, so downloads must not run arbitrarily far ahead
+        """
+        workers = 2
+        charts = [
+            make_chart("EDDF", f"Chart {i}", f"https://aip.example/{i}.png")
+            for i in range(20)
+        ]
+        scraper = FakeScraper()
+
+        consumed = 0
+        for _ in main._iter_chart_images(scraper, charts, workers=workers):
+            consumed += 1
+            assert len(scraper.requested) <= consumed + 2 * workers
+
+        assert consumed == len(charts)
+        assert len(scraper.requested) == len(charts)
+
+    def test_failed_download_yields_none(self):
+        """Test that a failed download is yielded with None instead of raising."""
+        charts = [
+            make_chart("EDDF", "Good", "https://aip.example/good.png"),
+            make_chart("EDDS", "Bad", "https://aip.example/bad.png"),
+        ]
+        scraper = FakeScraper(failing_urls={"https://aip.example/bad.png"})
+
+        results = {
+            chart["chart_name"]: image_data
+            for chart, image_data in main._iter_chart_images(scraper, charts, workers=2)
+        }
+
+        assert results == {"Good": b"image:https://aip.example/good.png", "Bad": None}
+
+
+class TestDownloadCharts:
+    """Test cases for downloading charts and generating their PDFs."""
+
+    def test_failed_charts_are_reported(self, tmp_path, monkeypatch):
+        """
+        Test that failed downloads are not counted and are listed as failures.
+        """
+        charts = [
+            make_chart("EDDF", "Good", "https://aip.example/good.png"),
+            make_chart("EDDS", "Bad", "https://aip.example/bad.png"),
+        ]
+        scraper = FakeScraper(failing_urls={"https://aip.example/bad.png"})
+        pdf_generator = FakePDFGenerator(tmp_path)
+        reported = []
+        monkeypatch.setattr(main, "display_failed_downloads", reported.extend)
+
+        downloaded, skipped = main._download_charts(scraper, pdf_generator, charts, workers=2)
+
+        assert (downloaded, skipped) == (1, 0)
+        assert pdf_generator.processed == ["Good"]
+        assert [chart["chart_name"] for chart in reported] == ["Bad"]
+
+    def test_existing_pdfs_are_skipped(self, tmp_path):
+        """
+        Test that charts with an existing, non-empty PDF are not downloaded again.
+
+        What this test does:
+        - One chart already has a PDF, one has an empty file, one has none
+        - Verifies only the last two are downloaded
+        - Verifies the skipped chart is reported separately from downloads
+        """
+        charts = [
+            make_chart("EDDF", "Done", "https://aip.example/done.png"),
+            make_chart("EDDS", "Empty", "https://aip.example/empty.png"),
+            make_chart("EDDM", "New", "https://aip.example/new.png"),
+        ]
+        scraper = FakeScraper()
+        pdf_generator = FakePDFGenerator(tmp_path)
+        pdf_generator.get_output_path(charts[0]).write_bytes(b"existing")
+        pdf_generator.get_output_path(charts[1]).write_bytes(b"")
+
+        downloaded, skipped = main._download_charts(scraper, pdf_generator, charts, workers=2)
+
+        assert (downloaded, skipped) == (2, 1)
+        assert "https://aip.example/done.png" not in scraper.requested
+        assert sorted(pdf_generator.processed) == ["Empty", "New"]
+        assert pdf_generator.get_output_path(charts[0]).read_bytes() == b"existing"
+
+    def test_force_regenerates_existing_pdfs(self, tmp_path):
+        """Test that force downloads and regenerates every chart."""
+        charts = [
+            make_chart("EDDF", "Done", "https://aip.example/done.png"),
+            make_chart("EDDM", "New", "https://aip.example/new.png"),
+        ]
+        scraper = FakeScraper()
+        pdf_generator = FakePDFGenerator(tmp_path)
+        pdf_generator.get_output_path(charts[0]).write_bytes(b"existing")
+
+        downloaded, skipped = main._download_charts(
+            scraper, pdf_generator, charts, workers=2, force=True
+        )
+
+        assert (downloaded, skipped) == (2, 0)
+        assert sorted(pdf_generator.processed) == ["Done", "New"]
+        assert (
+            pdf_generator.get_output_path(charts[0]).read_bytes()
+            == b"image:https://aip.example/done.png"
+        )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
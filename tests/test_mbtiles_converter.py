@@ -0,0 +1,281 @@
+"""
+Tests for the tile helpers of the MBTiles converter.
+
+The converter renders chart tiles from a Cloud Optimized GeoTIFF (COG) with
+rio-tiler. These tests cover the small NumPy/Pillow helpers it is built from,
+using synthetic arrays and small synthetic GeoTIFFs, so no FAA download or
+GDAL command-line tool is needed.
+
+What is being tested?
+---------------------
+- Lossless PNG encoding (paletted, gray+alpha and RGBA)
+- Alpha checks on packed pixel words
+- Completeness of the chunked, windowed pool map
+- Building a parent tile from its four children
+- Selecting the tiles that contain chart data
+- Moving an in-memory MBTiles load to disk
+"""
+
+import concurrent.futures
+import io
+import sqlite3
+
+import numpy as np
+import pytest
+from PIL import Image
+
+morecantile = pytest.importorskip("morecantile")
+rasterio = pytest.importorskip("rasterio")
+
+from rasterio.transform import from_bounds
+from rio_tiler.io import COGReader
+
+from src import mbtiles_converter as mc
+
+TMS = morecantile.tms.get("WebMercatorQuad")
+
+
+def decode_rgba(png: bytes) -> np.ndarray:
+    return np.asarray(Image.open(io.BytesIO(png)).convert("RGBA"))
+
+
+def write_geotiff(path, data: np.ndarray, bounds) -> None:
+    """Write a (bands, H, W) uint8 array as a tiled EPSG:3857 GeoTIFF with nodata 0."""
+    count, height, width = data.shape
+    with rasterio.open(
+        path,
+        "w",
+        driver="GTiff",
+        width=width,
+        height=height,
+        count=count,
+        dtype="uint8",
+        crs="EPSG:3857",
+        transform=from_bounds(bounds.left, bounds.bottom, bounds.right, bounds.top, width, height),
+        nodata=0,
+        tiled=True,
+        blockxsize=256,
+        blockysize=256,
+    ) as dst:
+        dst.write(data)
+
+
+class TestEncodePNG:
+    """Test cases for lossless tile PNG encoding."""
+
+    def test_paletted_round_trip(self):
+        """
+        Test that a tile with few colors is stored paletted and decodes unchanged.
+
+        Why this matters:
+        - The palette and its tRNS (alpha) entries are built by hand; a wrong
+          index would silently recolor chart pixels
+        """
+        rng = np.random.default_rng(0)
+        colors = rng.integers(0, 256, size=(200, 4), dtype=np.uint8)
+        colors[:10, 3] = 0  # transparent entries with different RGB
+        rgba = colors[rng.integers(0, len(colors), size=(64, 64))]
+
+        png = mc._encode_png(rgba)
+
+        assert Image.open(io.BytesIO(png)).mode == "P"
+        assert np.array_equal(decode_rgba(png), rgba)
+
+    def test_gray_alpha_round_trip(self):
+        """Test that a gray tile with more than 256 colors is stored as LA losslessly."""
+        rng = np.random.default_rng(1)
+        gray = rng.integers(0, 256, size=(64, 64), dtype=np.uint8)
+        alpha = rng.integers(0, 256, size=(64, 64), dtype=np.uint8)
+        rgba = np.dstack([gray, gray, gray, alpha])
+
+        png = mc._encode_png(rgba, gray=True)
+
+        assert Image.open(io.BytesIO(png)).mode == "LA"
+        assert np.array_equal(decode_rgba(png), rgba)
+
+    def test_rgba_round_trip(self):
+        """Test that a colorful tile is stored as RGBA losslessly."""
+        rng = np.random.default_rng(2)
+        rgba = rng.integers(0, 256, size=(64, 64, 4), dtype=np.uint8)
+
+        png = mc._encode_png(rgba)
+
+        assert Image.open(io.BytesIO(png)).mode == "RGBA"
+        assert np.array_equal(decode_rgba(png), rgba)
+
+
+class TestAlphaChecks:
+    """Test cases for the packed-word alpha checks."""
+
+    def test_alpha_is_empty(self):
+        """
+        Test _alpha_is_empty on LA and RGBA arrays.
+
+        What this test does:
+        - Bright colors under zero alpha still count as empty
+        - A single alpha of 1 in the last pixel does not
+        """
+        for channels in (2, 4):
+            pixels = np.full((8, 8, channels), 255, dtype=np.uint8)
+            pixels[..., -1] = 0
+            assert mc._alpha_is_empty(pixels)
+
+            pixels[-1, -1, -1] = 1
+            assert not mc._alpha_is_empty(pixels)
+
+    def test_alpha_is_empty_fallbacks(self):
+        """Test the non-contiguous and non-uint8 paths."""
+        pixels = np.zeros((8, 16, 4), dtype=np.uint8)
+        pixels[:, 1::2, 3] = 255
+        view = pixels[:, ::2]  # only the transparent columns, not contiguous
+        assert not view.flags.c_contiguous
+        assert mc._alpha_is_empty(view)
+        assert not mc._alpha_is_empty(pixels[:, 1::2])
+
+        assert mc._alpha_is_empty(np.zeros((4, 4, 4), dtype=np.float32))
+        assert not mc._alpha_is_empty(np.ones((4, 4, 2), dtype=np.uint16))
+
+    def test_alpha_bounds(self):
+        """Test that _alpha_bounds returns the min and max alpha, ignoring colors."""
+        rgba = np.full((8, 8, 4), 255, dtype=np.uint8)
+        assert mc._alpha_bounds(rgba) == (255, 255)
+
+        rgba[..., 3] = 0
+        assert mc._alpha_bounds(rgba) == (0, 0)
+
+        rgba[0, 0, 3] = 7
+        rgba[-1, -1, 3] = 200
+        assert mc._alpha_bounds(rgba) == (0, 200)
+
+
+class TestImapUnordered:
+    """Test cases for the chunked, windowed pool map."""
+
+    @pytest.mark.parametrize("chunksize,window", [(1, 1), (7, 3), (64, 2), (1000, 4)])
+    def test_every_item_mapped_once(self, chunksize, window):
+        """
+        Test that every item is mapped exactly once, whatever the chunking.
+
+        Why this matters:
+        - A lost or repeated chunk would drop or duplicate tiles
+        """
+        items = range(1001)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            results = list(
+                mc._imap_unordered(executor, lambda i: i * i, iter(items), chunksize, window)
+            )
+
+        assert sorted(results) == [i * i for i in items]
+
+
+class TestTileRendering:
+    """Test cases on small synthetic GeoTIFFs."""
+
+    def test_downsample_quad_matches_parent_read(self, tmp_path):
+        """
+        Test that a parent built from its four children matches reading it directly.
+
+        What this test does:
+        - Reads the four zoom 9 children of a zoom 8 tile and reduces them 2x2
+        - Reads the zoom 8 tile from the GeoTIFF with average resampling
+        - Compares both, including the transparent left edge
+
+        Why this matters:
+        - Overview zooms are built from children instead of read from the COG
+        """
+        x, y, z = 133, 85, 8
+        size = 1024
+        yy, xx = np.mgrid[0:size, 0:size]
+        data = np.stack(
+            [xx * 255 // size, yy * 255 // size, (xx + yy) * 255 // (2 * size)]
+        ).astype(np.uint8)
+        data[:, xx < 100] = 0
+        path = tmp_path / "chart.tif"
+        write_geotiff(path, data, TMS.xy_bounds(morecantile.Tile(x, y, z)))
+
+        with COGReader(str(path), tms=TMS) as cog:
+            children = []
+            for dy in (0, 1):
+                for dx in (0, 1):
+                    child, mask = cog.tile(2 * x + dx, 2 * y + dy, z + 1, tilesize=256)
+                    children.append(mc._tile_rgba(child, mask))
+            parent = mc._downsample_quad(children, 256)
+
+            data, mask = cog.tile(x, y, z, tilesize=256, resampling_method="average")
+            direct = mc._tile_rgba(data, mask)
+
+        assert np.array_equal(parent[..., 3], direct[..., 3])
+        opaque = direct[..., 3] == 255
+        diff = np.abs(parent.astype(int) - direct.astype(int))[..., :3]
+        assert diff[opaque].max() <= 2
+
+    def test_base_tiles_with_data_matches_per_tile_reads(self, tmp_path):
+        """
+        Test that the block read selects the same tiles as one read per tile.
+
+        What this test does:
+        - Builds a strip of 32 tiles: some full, some empty, and some
+          holding only a 1 px line, which a downsampled block read can miss
+        - Compares the selection with cog.tile on every tile
+
+        Why this matters:
+        - Tiles left out here are pruned with their whole subtree
+        """
+        zoom, tile_size, x0, y0 = 10, 256, 532, 340
+        tiles = [morecantile.Tile(x0 + i, y0, zoom) for i in range(32)]
+        data = np.zeros((3, tile_size, 32 * tile_size), dtype=np.uint8)
+        for i in range(0, 32, 4):
+            data[:, :, i * tile_size:(i + 1) * tile_size] = 200
+        for i, offset in zip(range(1, 32, 4), (0, 1, 2, 3, 101, 102, 254, 255)):
+            data[:, :, i * tile_size + offset] = 90
+        upper_left = TMS.xy_bounds(tiles[0])
+        lower_right = TMS.xy_bounds(tiles[-1])
+        bounds = morecantile.commons.BoundingBox(
+            upper_left.left, lower_right.bottom, lower_right.right, upper_left.top
+        )
+        path = tmp_path / "strip.tif"
+        write_geotiff(path, data, bounds)
+
+        with COGReader(str(path), tms=TMS) as cog:
+            selected = mc._base_tiles_with_data(cog, TMS, tiles, zoom, tile_size, 1)
+            per_tile = set()
+            for tile in tiles:
+                _, mask = cog.tile(tile.x, tile.y, zoom, tilesize=tile_size)
+                if mask.max() > 1:
+                    per_tile.add((tile.x, tile.y))
+
+        assert len(per_tile) == 16
+        assert selected == per_tile
+
+
+class TestBulkWrite:
+    """Test cases for the bulk MBTiles writer."""
+
+    def test_spill_to_disk_keeps_loading(self, tmp_path):
+        """
+        Test that a load moved from RAM to disk keeps every tile.
+
+        What this test does:
+        - Writes a batch in memory, spills to disk, writes another batch
+          (including a rewrite of an earlier tile) and finishes the file
+
+        Why this matters:
+        - Outputs larger than the in-memory estimate are moved mid-load
+        """
+        path = tmp_path / "chart.mbtiles"
+        conn = mc._open_mbtiles_for_bulk_write(path, in_memory=True)
+        mc._write_tile_batch(conn, [(1, 0, 0, b"a"), (1, 1, 0, b"b")])
+
+        conn = mc._spill_mbtiles_to_disk(conn, path)
+        mc._write_tile_batch(conn, [(1, 0, 1, b"c"), (1, 0, 0, b"d")])
+        mc._finish_mbtiles_bulk_write(conn)
+
+        with sqlite3.connect(path) as db:
+            rows = db.execute("SELECT * FROM tiles ORDER BY 1, 2, 3").fetchall()
+            journal = db.execute("PRAGMA journal_mode").fetchone()[0]
+        assert rows == [(1, 0, 0, b"d"), (1, 0, 1, b"c"), (1, 1, 0, b"b")]
+        assert journal == "delete"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
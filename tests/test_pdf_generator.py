@@ -212,6 +212,31 @@ class TestPDFGenerator:
             # Should not have EDFE again in the chart name part
             assert parts[2].startswith("Frankfurt")  # Chart name without duplicate ICAO
 
+    def test_get_output_path(self):
+        """
+        Test the output path of a chart's PDF.
+
+        What this test does:
+        - Verifies the path is the BYOP filename inside the byop/ folder
+
+        Why this matters:
+        - The download command checks this path to skip charts whose PDF
+          already exists, so it must match where process_chart writes
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generator = PDFGenerator(output_dir=tmpdir)
+
+            chart_info = {
+                "icao_code": "EDFE",
+                "chart_name": "EDFE Frankfurt-Egelsbach 5",
+            }
+
+            output_path = generator.get_output_path(chart_info)
+
+            assert output_path == (
+                Path(tmpdir) / "byop" / generator.generate_byop_filename(chart_info)
+            )
+
     @patch('src.pdf_generator.img2pdf.convert')
     def test_image_to_pdf(self, mock_convert, tmp_path):
         """
@@ -233,9 +258,11 @@ class TestPDFGenerator:
         with tempfile.TemporaryDirectory() as tmpdir:
             generator = PDFGenerator(output_dir=tmpdir)
             
-            # Mock PDF conversion
+            # Mock PDF conversion (img2pdf writes into the output stream)
             fake_pdf_data = b"fake pdf content"
-            mock_convert.return_value = fake_pdf_data
+            mock_convert.side_effect = (
+                lambda image, outputstream: outputstream.write(fake_pdf_data)
+            )
             
             # Test image data (fake)
             image_data = b"fake image data"
@@ -253,6 +280,34 @@ class TestPDFGenerator:
             # Verify file content
             assert output_path.read_bytes() == fake_pdf_data
 
+    @patch('src.pdf_generator.img2pdf.convert')
+    def test_image_to_pdf_failure_removes_partial_file(self, mock_convert, tmp_path):
+        """
+        Test that a failed conversion does not leave a PDF behind.
+
+        What this test does:
+        - Makes the mocked img2pdf write some bytes and then fail
+        - Verifies the half-written file is removed
+
+        Why this matters:
+        - PDFs are streamed straight to disk, so a failure mid-write would
+          otherwise leave a corrupt chart in the BYOP folder
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generator = PDFGenerator(output_dir=tmpdir)
+
+            def fail_midway(image, outputstream):
+                outputstream.write(b"%PDF-partial")
+                raise ValueError("bad image")
+
+            mock_convert.side_effect = fail_midway
+            output_path = Path(tmpdir) / "test.pdf"
+
+            result = generator.image_to_pdf(b"fake image data", output_path)
+
+            assert result is False
+            assert not output_path.exists()
+
     @patch('src.pdf_generator.PDFGenerator.image_to_pdf')
     def test_process_chart(self, mock_image_to_pdf, tmp_path):
         """
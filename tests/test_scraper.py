@@ -15,6 +15,12 @@ class TestAIPScraper:
         assert scraper.base_url == "https://aip.dfs.de"
         assert "User-Agent" in scraper.session.headers
 
+    def test_init_connection_pool(self):
+        """Test the session keeps a connection pool of the requested size."""
+        scraper = AIPScraper(max_connections=4)
+        adapter = scraper.session.get_adapter("https://aip.dfs.de/")
+        assert adapter._pool_maxsize == 4
+
     def test_build_print_url(self):
         """Test print URL building."""
         scraper = AIPScraper()
@@ -82,6 +88,23 @@ class TestAIPScraper:
         mock_extract_vfr.assert_called_once()
         assert mock_make_request.call_count == 2  # Called for VFR Online and aerodromes
 
+    def test_download_chart_image_sends_referrer_per_request(self):
+        """Test the referrer is sent with the request, not stored on the session."""
+        scraper = AIPScraper()
+        mock_response = Mock()
+        mock_response.headers = {"Content-Type": "image/png"}
+        mock_response.content = b"x" * 2000
+        scraper.session.get = Mock(return_value=mock_response)
+
+        result = scraper.download_chart_image(
+            "https://aip.dfs.de/print", "https://aip.dfs.de/page"
+        )
+
+        assert result == mock_response.content
+        _, kwargs = scraper.session.get.call_args
+        assert kwargs["headers"]["Referer"] == "https://aip.dfs.de/page"
+        assert "Referer" not in scraper.session.headers
+
     @patch('src.scraper.AIPScraper.get_aerodromes_from_section')
     def test_extract_aerodrome_links(self, mock_get_aerodromes):
         """Test aerodrome link extraction."""